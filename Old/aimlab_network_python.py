@@ -8,7 +8,7 @@ This module provides a robust UDP-based network communication system with:
 - Bidirectional communication
 - Heartbeat mechanism for connection monitoring
 - Thread-safe message queuing
-- Asyncio-based event-driven architecture
+- Selector-based event-driven I/O with timer-driven discovery and heartbeats
 
 Author: AIMLAB Development Team
 Version: 1.0.0
@@ -16,12 +16,15 @@ Version: 1.0.0
 Requirements:
     - Python 3.7+
     - No external dependencies (uses standard library only)
+    - Optional: orjson for faster JSON encoding of VR data
+    - Optional: msgpack for compact VR data between Python peers
 
 Usage:
     python aimlab_network_python.py [--no-discovery]
 """
 
 import socket
+import errno
 import struct
 import json
 import threading
@@ -31,14 +34,30 @@ import sys
 import os
 import logging
 import argparse
-import asyncio
+import random
 import ipaddress
+import selectors
+import functools
+import ctypes
+import ctypes.util
+from collections import deque
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Dict, List, Optional, Callable, Tuple, Any
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Callable, Tuple, Any, Union
 import traceback
 
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+try:
+    import msgpack
+    HAVE_MSGPACK = True
+except ImportError:
+    HAVE_MSGPACK = False
+
 
 # Configure logging
 logging.basicConfig(
@@ -48,6 +67,41 @@ logging.basicConfig(
 logger = logging.getLogger('AIMLAB_VR')
 
 
+# sendmmsg(2)/recvmmsg(2) move a whole batch of datagrams in one syscall
+# (Linux only)
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p), ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_IOVec)), ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p), ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+
+_libc_sendmmsg = None
+_libc_recvmmsg = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        _libc_sendmmsg = _libc.sendmmsg
+        _libc_sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p,
+                                   ctypes.c_uint, ctypes.c_int]
+        _libc_sendmmsg.restype = ctypes.c_int
+        _libc_recvmmsg = _libc.recvmmsg
+        _libc_recvmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p,
+                                   ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+        _libc_recvmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _libc_sendmmsg = None
+        _libc_recvmmsg = None
+
+
 class NetworkConfig:
     """Configuration parameters for the network module."""
     
@@ -58,12 +112,24 @@ class NetworkConfig:
     HEARTBEAT_INTERVAL_MS: int = 5000
     CONNECTION_TIMEOUT_MS: int = 15000
     PROTOCOL_VERSION: str = "1.0"
+    # Advertised in the handshake by peers that accept DATA_PACKED messages;
+    # peers that send plain "1.0" (e.g. the C++ module) keep getting JSON
+    MSGPACK_PROTOCOL_VERSION: str = "1.0+msgpack"
     APP_IDENTIFIER: str = "AIMLAB_VR"
     
     # Network settings
     BROADCAST_ADDRESS: str = "255.255.255.255"
     MAX_PEERS: int = 10
     RECV_TIMEOUT: float = 0.1
+    SOCKET_BUFFER_SIZE: int = 8 * 1024 * 1024  # Kernel caps at net.core.[rw]mem_max
+    
+    # Sockets sharing the data port via SO_REUSEPORT; the kernel hashes
+    # incoming flows across them and each extra socket is drained by its own
+    # receive thread (only used where SO_REUSEPORT exists)
+    RECEIVE_SOCKETS: int = min(os.cpu_count() or 1, 4)
+    
+    # Datagrams pulled per recvmmsg call
+    RECV_BATCH_SIZE: int = 32
     
     @classmethod
     def to_dict(cls) -> dict:
@@ -87,17 +153,39 @@ class MessageType(IntEnum):
     HEARTBEAT = 6
     DISCONNECT = 7
     MSG_ERROR = 8  # Renamed from ERROR to avoid Windows conflicts
+    DATA_PACKED = 9  # msgpack payload, only sent to peers that negotiated it
+
+
+# Wire frames are "<type>|<payload>" (shared with the C++ peer); the type
+# prefix is encoded once per type instead of formatted per message
+_TYPE_PREFIX: Dict[MessageType, bytes] = {t: f"{int(t)}|".encode('ascii') for t in MessageType}
 
+# Heartbeats carry no payload, so every peer gets the same frame
+_HEARTBEAT_WIRE = _TYPE_PREFIX[MessageType.HEARTBEAT]
 
-@dataclass
+
+# Per-packet records drop their instance __dict__ where dataclasses support it
+_slotted_dataclass = dataclass(slots=True) if sys.version_info >= (3, 10) else dataclass
+
+
+@_slotted_dataclass
 class Message:
-    """Represents a network message with type and payload."""
+    """
+    Represents a network message with type and payload.
+    
+    payload is always the message text. payload_bytes holds a pre-encoded
+    payload to send, or the raw msgpack body of a received DATA_PACKED
+    frame; such frames are delivered as DATA messages with payload set to
+    the equivalent JSON text and data to the decoded object.
+    """
     
     type: MessageType
     payload: str = ""
     sender_ip: str = ""
     sender_port: int = 0
     timestamp: float = field(default_factory=time.time)
+    payload_bytes: bytes = b""
+    data: Any = None
     
     def serialize(self) -> bytes:
         """
@@ -106,8 +194,8 @@ class Message:
         Returns:
             bytes: Serialized message
         """
-        message_str = f"{int(self.type)}|{self.payload}"
-        return message_str.encode('utf-8')
+        # Pre-encoded payloads (e.g. VR data) skip the str round trip
+        return _TYPE_PREFIX[self.type] + (self.payload_bytes or self.payload.encode('utf-8'))
     
     @classmethod
     def deserialize(cls, data: bytes) -> 'Message':
@@ -121,50 +209,108 @@ class Message:
             Message: Deserialized message object
         """
         try:
-            message_str = data.decode('utf-8')
-            parts = message_str.split('|', 1)
-            if len(parts) >= 2:
-                msg_type = MessageType(int(parts[0]))
-                payload = parts[1]
+            # Split on the raw bytes so only the payload gets decoded
+            head, sep, body = data.partition(b'|')
+            if sep:
+                msg_type = MessageType(int(head))
+                if msg_type == MessageType.DATA_PACKED:
+                    # Binary payload; never decoded as text
+                    return cls(type=msg_type, payload_bytes=body)
+                payload = body.decode('utf-8')
             else:
                 msg_type = MessageType.MSG_ERROR
                 payload = ""
             return cls(type=msg_type, payload=payload)
         except Exception as e:
-            logger.error(f"Failed to deserialize message: {e}")
+            logger.error("Failed to deserialize message: %s", e)
             return cls(type=MessageType.MSG_ERROR, payload=str(e))
 
 
-@dataclass
+@_slotted_dataclass
+class Broadcast:
+    """One serialized frame queued once for several destinations."""
+    
+    wire: bytes
+    dests: List[Tuple[Tuple[str, int], bytes]]  # (addr, sockaddr) per peer
+
+
+@_slotted_dataclass
 class PeerInfo:
     """Information about a connected peer."""
     
     ip_address: str
     port: int
-    last_heartbeat: float = field(default_factory=time.time)
+    last_heartbeat: float = field(default_factory=time.monotonic)  # Immune to clock jumps
     is_connected: bool = False
     protocol_version: str = ""
+    addr: Tuple[str, int] = field(init=False, repr=False)
+    sockaddr: bytes = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        """Build the send addresses once for the lifetime of the peer."""
+        self.addr = (self.ip_address, self.port)
+        self.sockaddr = _sockaddr_in(self.ip_address, self.port)
     
-    def is_timeout(self) -> bool:
+    def is_timeout(self, now: Optional[float] = None) -> bool:
         """
         Check if peer connection has timed out.
         
+        Args:
+            now: Current time.monotonic() value, read once by callers that
+                 check many peers
+        
         Returns:
             bool: True if timed out, False otherwise
         """
-        elapsed = (time.time() - self.last_heartbeat) * 1000
+        if now is None:
+            now = time.monotonic()
+        elapsed = (now - self.last_heartbeat) * 1000
         return elapsed > NetworkConfig.CONNECTION_TIMEOUT_MS
     
     def update_heartbeat(self):
         """Update the last heartbeat timestamp."""
-        self.last_heartbeat = time.time()
+        self.last_heartbeat = time.monotonic()
+    
+    @property
+    def supports_msgpack(self) -> bool:
+        """Whether the peer advertised msgpack support in its handshake."""
+        return HAVE_MSGPACK and self.protocol_version == NetworkConfig.MSGPACK_PROTOCOL_VERSION
     
     @property
     def peer_id(self) -> str:
-        """Get unique identifier for this peer."""
+        """Get printable identifier for this peer (peers are keyed by _peer_key)."""
         return f"{self.ip_address}:{self.port}"
 
 
+# Version string this side sends in HANDSHAKE_START/ACK
+_LOCAL_PROTOCOL_VERSION = (
+    NetworkConfig.MSGPACK_PROTOCOL_VERSION if HAVE_MSGPACK else NetworkConfig.PROTOCOL_VERSION
+)
+
+# Handshake frames never change, so they are built once and sent directly
+_HANDSHAKE_START_WIRE = Message(MessageType.HANDSHAKE_START, _LOCAL_PROTOCOL_VERSION).serialize()
+_HANDSHAKE_ACK_WIRE = Message(MessageType.HANDSHAKE_ACK, _LOCAL_PROTOCOL_VERSION).serialize()
+_HANDSHAKE_COMPLETE_WIRE = Message(MessageType.HANDSHAKE_COMPLETE).serialize()
+
+
+def _peer_key(ip: str, port: int) -> Tuple[bytes, int]:
+    """
+    Build the peer table key for an address.
+    
+    A (packed IPv4, port) tuple hashes faster than an "ip:port" string and
+    inet_aton runs in C, so per-packet lookups avoid string formatting.
+    """
+    return socket.inet_aton(ip), port
+
+
+_AF_INET_NATIVE = struct.pack('=H', socket.AF_INET)
+
+
+def _sockaddr_in(ip: str, port: int) -> bytes:
+    """Pack an IPv4 address as a raw Linux struct sockaddr_in for sendmmsg."""
+    return _AF_INET_NATIVE + struct.pack('!H4s8x', port, socket.inet_aton(ip))
+
+
 class UDPSocket:
     """Wrapper class for UDP socket operations."""
     
@@ -174,6 +320,12 @@ class UDPSocket:
         self.is_valid: bool = False
         self.local_port: int = 0
         
+        # recvmmsg buffers, allocated on first receive_batch call
+        self._recv_buffers = None
+        self._recv_names = None
+        self._recv_iovecs = None
+        self._recv_msgs = None
+        
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -182,12 +334,13 @@ class UDPSocket:
         """Context manager exit."""
         self.close()
     
-    def initialize(self, port: int = 0) -> bool:
+    def initialize(self, port: int = 0, reuse_port: bool = False) -> bool:
         """
         Initialize socket and bind to specified port.
         
         Args:
             port: Port number to bind (0 for auto-assignment)
+            reuse_port: Set SO_REUSEPORT so several sockets can share the port
             
         Returns:
             bool: True if successful, False otherwise
@@ -201,6 +354,16 @@ class UDPSocket:
             
             # Enable address reuse
             self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            if reuse_port:
+                self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            
+            # Large kernel buffers absorb VR bursts instead of dropping them
+            for option in (socket.SO_RCVBUF, socket.SO_SNDBUF):
+                try:
+                    self.socket.setsockopt(socket.SOL_SOCKET, option,
+                                           NetworkConfig.SOCKET_BUFFER_SIZE)
+                except OSError as e:
+                    logger.warning(f"Could not enlarge socket buffer: {e}")
             
             # Set non-blocking mode
             self.socket.setblocking(False)
@@ -213,6 +376,10 @@ class UDPSocket:
             
             self.is_valid = True
             logger.info(f"Socket initialized on port {self.local_port}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Socket buffers: rcv=%d snd=%d",
+                             self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+                             self.socket.getsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF))
             return True
             
         except Exception as e:
@@ -239,9 +406,78 @@ class UDPSocket:
         try:
             return self.socket.sendto(data, (ip, port))
         except Exception as e:
-            logger.error(f"Failed to send data to {ip}:{port}: {e}")
+            logger.error("Failed to send data to %s:%d: %s", ip, port, e)
             return -1
     
+    def send_batch(self, packets: List[Tuple[bytes, Tuple[str, int], Optional[bytes]]]) -> int:
+        """
+        Send several datagrams, using one sendmmsg call where available.
+        
+        Args:
+            packets: List of (data, (ip, port), sockaddr) tuples; sockaddr is
+                     the peer's cached _sockaddr_in, or None to build it here
+            
+        Returns:
+            int: Number of datagrams sent
+        """
+        if not self.is_valid or not packets:
+            return 0
+        
+        if _libc_sendmmsg is None:
+            return sum(self.send_to(data, *addr) >= 0 for data, addr, _ in packets)
+        
+        # Point the iovecs and names straight at each bytes object's buffer
+        # (no copy); a frame or peer address shared by many packets is
+        # resolved only once. Everything stays referenced until sendmmsg returns.
+        count = len(packets)
+        built = []
+        addresses: Dict[int, int] = {}
+        iovecs = (_IOVec * count)()
+        msgs = (_MMsgHdr * count)()
+        
+        try:
+            for i, (data, addr, sockaddr) in enumerate(packets):
+                if sockaddr is None:
+                    sockaddr = _sockaddr_in(*addr)
+                    built.append(sockaddr)
+                base = addresses.get(id(data))
+                if base is None:
+                    base = addresses[id(data)] = ctypes.cast(data, ctypes.c_void_p).value
+                name = addresses.get(id(sockaddr))
+                if name is None:
+                    name = addresses[id(sockaddr)] = ctypes.cast(sockaddr, ctypes.c_void_p).value
+                iovecs[i].iov_base = base
+                iovecs[i].iov_len = len(data)
+                hdr = msgs[i].msg_hdr
+                hdr.msg_name = name
+                hdr.msg_namelen = len(sockaddr)
+                hdr.msg_iov = ctypes.pointer(iovecs[i])
+                hdr.msg_iovlen = 1
+        except (OSError, struct.error) as e:
+            # Not a dotted IPv4 address; let sendto resolve it
+            logger.debug("Falling back to sendto for batch: %s", e)
+            return sum(self.send_to(data, *addr) >= 0 for data, addr, _ in packets)
+        
+        # The kernel may accept only part of the batch; resubmit the rest.
+        # An error refers to the first unsent datagram, which is skipped so
+        # one bad destination does not drop the rest of the batch.
+        done = 0
+        failed = 0
+        fd = self.socket.fileno()
+        while done < count:
+            result = _libc_sendmmsg(fd, ctypes.addressof(msgs[done]), count - done, 0)
+            if result < 0:
+                err = ctypes.get_errno()
+                if err == errno.EINTR:
+                    continue
+                _, addr, _ = packets[done]
+                logger.error("Failed to send to %s:%d: %s", addr[0], addr[1], os.strerror(err))
+                failed += 1
+                done += 1
+                continue
+            done += result
+        return count - failed
+    
     def broadcast(self, data: bytes, port: int) -> int:
         """
         Broadcast data to all hosts on local network.
@@ -275,9 +511,60 @@ class UDPSocket:
             # No data available (non-blocking)
             return None
         except Exception as e:
-            logger.error(f"Failed to receive data: {e}")
+            logger.error("Failed to receive data: %s", e)
             return None
     
+    def receive_batch(self) -> List[Tuple[bytes, str, int]]:
+        """
+        Receive every queued datagram up to RECV_BATCH_SIZE (non-blocking).
+        
+        Uses a single recvmmsg call into preallocated buffers where available,
+        otherwise a single recvfrom.
+        
+        Returns:
+            List of (data, sender_ip, sender_port); empty if no data
+        """
+        if not self.is_valid:
+            return []
+        
+        if _libc_recvmmsg is None:
+            result = self.receive_from()
+            return [result] if result else []
+        
+        count = NetworkConfig.RECV_BATCH_SIZE
+        if self._recv_msgs is None:
+            self._recv_buffers = (ctypes.c_char * NetworkConfig.BUFFER_SIZE * count)()
+            self._recv_names = (ctypes.c_char * 16 * count)()
+            self._recv_iovecs = (_IOVec * count)()
+            self._recv_msgs = (_MMsgHdr * count)()
+            for i in range(count):
+                self._recv_iovecs[i].iov_base = ctypes.addressof(self._recv_buffers[i])
+                self._recv_iovecs[i].iov_len = NetworkConfig.BUFFER_SIZE
+                hdr = self._recv_msgs[i].msg_hdr
+                hdr.msg_name = ctypes.addressof(self._recv_names[i])
+                hdr.msg_iov = ctypes.pointer(self._recv_iovecs[i])
+                hdr.msg_iovlen = 1
+        
+        # The kernel overwrites the name length, so reset it before each call
+        for i in range(count):
+            self._recv_msgs[i].msg_hdr.msg_namelen = 16
+        
+        received = _libc_recvmmsg(self.socket.fileno(), ctypes.addressof(self._recv_msgs),
+                                  count, socket.MSG_DONTWAIT, None)
+        if received < 0:
+            err = ctypes.get_errno()
+            if err not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                logger.error("Failed to receive batch: %s", os.strerror(err))
+            return []
+        
+        packets = []
+        for i in range(received):
+            data = ctypes.string_at(self._recv_buffers[i], self._recv_msgs[i].msg_len)
+            name = self._recv_names[i].raw
+            port = int.from_bytes(name[2:4], 'big')
+            packets.append((data, socket.inet_ntoa(name[4:8]), port))
+        return packets
+    
     def close(self):
         """Close the socket."""
         if self.socket:
@@ -289,24 +576,132 @@ class UDPSocket:
             self.is_valid = False
 
 
+class RingQueue:
+    """
+    Bounded message queue with the get/put interface of queue.Queue.
+    
+    Built on a deque, whose append and popleft are atomic, so the hot path
+    takes no lock; an Event only wakes a consumer waiting on an empty queue.
+    When full, the oldest message is dropped, like a lossy UDP buffer;
+    drops are counted in `dropped` and reported by a rate-limited warning.
+    """
+    
+    # Minimum seconds between two overflow warnings for one queue
+    DROP_WARNING_INTERVAL: float = 5.0
+    
+    def __init__(self, maxlen: int = 1024, name: str = "queue"):
+        """
+        Initialize the ring with room for maxlen messages.
+        
+        Args:
+            maxlen: Capacity before the oldest messages are dropped
+            name: Queue name used in overflow warnings
+        """
+        self._items: deque = deque(maxlen=maxlen)
+        self._ready = threading.Event()
+        self.name = name
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+        self._dropped_reported = 0
+        self._next_drop_warning = 0.0
+    
+    def put(self, item: Any):
+        """Append an item and wake any waiting consumer."""
+        items = self._items
+        if len(items) == items.maxlen:
+            self._record_drop()
+        items.append(item)
+        self._ready.set()
+    
+    def _record_drop(self):
+        """Count a message about to be dropped and warn at most once per interval."""
+        with self._drop_lock:
+            self.dropped += 1
+            now = time.monotonic()
+            if now < self._next_drop_warning:
+                return
+            self._next_drop_warning = now + self.DROP_WARNING_INTERVAL
+            new_drops = self.dropped - self._dropped_reported
+            self._dropped_reported = self.dropped
+        logger.warning("%s queue full: dropped %d oldest message(s) (%d total)",
+                       self.name, new_drops, self.dropped)
+    
+    def get_nowait(self) -> Any:
+        """
+        Pop the oldest item without waiting.
+        
+        Raises:
+            queue.Empty: If no item is available
+        """
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty from None
+    
+    def get(self, timeout: Optional[float] = None) -> Any:
+        """
+        Pop the oldest item, waiting up to timeout seconds for one.
+        
+        Raises:
+            queue.Empty: If no item arrived in time
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            
+            # Clear before re-checking so a put in between is never missed
+            self._ready.clear()
+            if self._items:
+                continue
+            
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            if not self._ready.wait(remaining):
+                raise queue.Empty
+    
+    def qsize(self) -> int:
+        """Return the number of queued items."""
+        return len(self._items)
+
+
 class NetworkManager:
     """Main class managing network operations and peer connections."""
     
+    # Maximum number of queued messages handed to one send_batch call
+    SEND_BATCH_SIZE: int = 64
+    
     def __init__(self):
         """Initialize the network manager."""
         self.discovery_socket = UDPSocket()
         self.data_socket = UDPSocket()
-        self.peers: Dict[str, PeerInfo] = {}
-        self.incoming_messages = queue.Queue()
-        self.outgoing_messages = queue.Queue()
+        self._extra_data_sockets: List[UDPSocket] = []
+        self.peers: Dict[Tuple[bytes, int], PeerInfo] = {}
+        self.incoming_messages = RingQueue(name="Incoming")
+        self.outgoing_messages = RingQueue(name="Outgoing")
         
-        self._peers_lock = threading.RLock()
+        # Never acquired recursively, so a plain Lock is enough
+        self._peers_lock = threading.Lock()
         self._running = False
         self._discovering = False
         
         self._threads: List[threading.Thread] = []
+        self._selector: Optional[selectors.BaseSelector] = None
         self.message_handler: Optional[Callable[[Message], None]] = None
         
+        # Per-type handlers for messages arriving on the data port
+        self._dispatch: Dict[MessageType, Callable[[Message], None]] = {
+            MessageType.HANDSHAKE_START: self._handle_handshake_start,
+            MessageType.HANDSHAKE_ACK: self._handle_handshake_ack,
+            MessageType.HANDSHAKE_COMPLETE: self._handle_handshake_complete,
+            MessageType.DATA: self._deliver_data,
+            MessageType.DATA_PACKED: self._deliver_packed_data,
+            MessageType.DISCONNECT: self._handle_disconnect,
+        }
+        
     def start(self, enable_discovery: bool = True) -> bool:
         """
         Start the network manager.
@@ -326,21 +721,39 @@ class NetworkManager:
             logger.error("Failed to initialize discovery socket")
             return False
         
-        if not self.data_socket.initialize(NetworkConfig.DEFAULT_DATA_PORT):
+        reuse_port = hasattr(socket, 'SO_REUSEPORT') and NetworkConfig.RECEIVE_SOCKETS > 1
+        if not self.data_socket.initialize(NetworkConfig.DEFAULT_DATA_PORT, reuse_port):
             logger.error("Failed to initialize data socket")
             self.discovery_socket.close()
             return False
         
+        # Extra receive sockets on the same port; sends stay on data_socket
+        if reuse_port:
+            for _ in range(NetworkConfig.RECEIVE_SOCKETS - 1):
+                sock = UDPSocket()
+                if not sock.initialize(self.data_socket.local_port, reuse_port=True):
+                    break
+                self._extra_data_sockets.append(sock)
+        
         self._running = True
         self._discovering = enable_discovery
         
-        # Start worker threads
+        # Block on both sockets at once (epoll on Linux) instead of polling
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self.data_socket.socket, selectors.EVENT_READ,
+                                functools.partial(self._drain_data_socket, self.data_socket))
         if enable_discovery:
-            self._start_thread(self._discovery_worker, "Discovery")
+            self._selector.register(self.discovery_socket.socket, selectors.EVENT_READ,
+                                    self._drain_discovery_socket)
         
-        self._start_thread(self._receive_worker, "Receive")
+        # Start worker threads; discovery and heartbeats run on the IO thread
+        self._start_thread(self._io_worker, "IO")
         self._start_thread(self._send_worker, "Send")
-        self._start_thread(self._heartbeat_worker, "Heartbeat")
+        
+        # Each extra receive socket gets its own thread, so datagrams the
+        # kernel spreads across them are received and parsed concurrently
+        for i, sock in enumerate(self._extra_data_sockets, 1):
+            self._start_thread(functools.partial(self._receive_worker, sock), f"Receive-{i}")
         
         logger.info(f"Network manager started on port {self.data_socket.local_port}")
         return True
@@ -363,35 +776,66 @@ class NetworkManager:
         for thread in self._threads:
             thread.join(timeout=2.0)
         
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        
         # Close sockets
         self.discovery_socket.close()
         self.data_socket.close()
+        for sock in self._extra_data_sockets:
+            sock.close()
+        self._extra_data_sockets.clear()
         
         logger.info("Network manager stopped")
     
-    def send_to_peer(self, ip_address: str, port: int, data: str):
+    def send_to_peer(self, ip_address: str, port: int, data: Union[str, bytes]):
         """
         Send a message to a specific peer.
         
         Args:
             ip_address: Peer's IP address
             port: Peer's port
-            data: Data to send
+            data: Data to send, as text or already UTF-8 encoded bytes
         """
-        msg = Message(MessageType.DATA, data, ip_address, port)
+        if isinstance(data, bytes):
+            msg = Message(MessageType.DATA, "", ip_address, port, payload_bytes=data)
+        else:
+            msg = Message(MessageType.DATA, data, ip_address, port)
         self.outgoing_messages.put(msg)
     
-    def broadcast_to_peers(self, data: str):
+    def broadcast_to_peers(self, data: Union[str, bytes], obj: Any = None):
         """
         Broadcast a message to all connected peers.
         
         Args:
-            data: Data to broadcast
+            data: Data to broadcast, as text or already UTF-8 encoded bytes
+            obj: Optional object data was encoded from; peers that negotiated
+                 msgpack in the handshake get it msgpack-encoded instead,
+                 packed only when such a peer is connected
         """
+        dests = []
+        packed_dests = []
         with self._peers_lock:
             for peer_info in self.peers.values():
                 if peer_info.is_connected:
-                    self.send_to_peer(peer_info.ip_address, peer_info.port, data)
+                    if obj is not None and peer_info.supports_msgpack:
+                        packed_dests.append((peer_info.addr, peer_info.sockaddr))
+                    else:
+                        dests.append((peer_info.addr, peer_info.sockaddr))
+        
+        # Serialize once per encoding and let the send worker fan it out
+        if dests:
+            if isinstance(data, str):
+                msg = Message(MessageType.DATA, data)
+            else:
+                msg = Message(MessageType.DATA, payload_bytes=data)
+            self.outgoing_messages.put(Broadcast(msg.serialize(), dests))
+        if packed_dests:
+            # float32 is ample for tracking data and halves the float bytes
+            packed = msgpack.packb(obj, use_single_float=True)
+            msg = Message(MessageType.DATA_PACKED, payload_bytes=packed)
+            self.outgoing_messages.put(Broadcast(msg.serialize(), packed_dests))
     
     def get_message(self) -> Optional[Message]:
         """
@@ -409,6 +853,10 @@ class NetworkManager:
         """
         Set custom message handler callback.
         
+        The handler runs on the receiving thread (the IO worker or one of
+        the receive workers), so it must be thread-safe; messages from one
+        peer always arrive on the same thread.
+        
         Args:
             handler: Function to handle incoming messages
         """
@@ -421,10 +869,11 @@ class NetworkManager:
         Returns:
             List of peer information objects
         """
+        now = time.monotonic()
         with self._peers_lock:
             return [
                 peer for peer in self.peers.values()
-                if peer.is_connected and not peer.is_timeout()
+                if peer.is_connected and not peer.is_timeout(now)
             ]
     
     def _start_thread(self, target: Callable, name: str):
@@ -433,61 +882,105 @@ class NetworkManager:
         thread.start()
         self._threads.append(thread)
     
-    def _discovery_worker(self):
-        """Worker thread for peer discovery."""
-        logger.info("Discovery worker started")
+    def _io_worker(self):
+        """
+        Worker thread running the socket event loop.
         
-        while self._discovering:
+        Waits on both sockets and drains whichever is readable; the select
+        timeout doubles as the timer for discovery broadcasts and heartbeats.
+        """
+        logger.info("IO worker started")
+        
+        discovery_interval = NetworkConfig.DISCOVERY_INTERVAL_MS / 1000.0
+        heartbeat_interval = NetworkConfig.HEARTBEAT_INTERVAL_MS / 1000.0
+        next_discovery = next_heartbeat = time.monotonic()
+        
+        while self._running:
             try:
-                # Send discovery broadcast
-                discovery_msg = f"{NetworkConfig.APP_IDENTIFIER}:{self.data_socket.local_port}"
-                msg = Message(MessageType.DISCOVER, discovery_msg)
-                self.discovery_socket.broadcast(msg.serialize(), NetworkConfig.DISCOVERY_PORT)
+                now = time.monotonic()
+                if self._discovering and now >= next_discovery:
+                    self._send_discovery()
+                    next_discovery = now + discovery_interval
+                if now >= next_heartbeat:
+                    self._heartbeat_tick()
+                    next_heartbeat = now + heartbeat_interval
                 
-                # Check for discovery responses
-                result = self.discovery_socket.receive_from()
-                while result:
-                    data, sender_ip, sender_port = result
-                    self._handle_discovery_message(data, sender_ip)
-                    result = self.discovery_socket.receive_from()
+                # Sleep until the next timer, but wake regularly to notice stop()
+                deadline = min(next_heartbeat, next_discovery) if self._discovering else next_heartbeat
+                timeout = min(max(deadline - time.monotonic(), 0.0), 0.5)
+                for key, _ in self._selector.select(timeout):
+                    key.data()
                 
             except Exception as e:
-                logger.error(f"Discovery worker error: {e}")
-            
-            time.sleep(NetworkConfig.DISCOVERY_INTERVAL_MS / 1000.0)
+                logger.error(f"IO worker error: {e}")
         
-        logger.info("Discovery worker stopped")
+        logger.info("IO worker stopped")
     
-    def _receive_worker(self):
-        """Worker thread for receiving messages."""
+    def _receive_worker(self, sock: UDPSocket):
+        """Worker thread draining one extra SO_REUSEPORT data socket."""
         logger.info("Receive worker started")
         
-        while self._running:
-            try:
-                result = self.data_socket.receive_from()
-                if result:
-                    data, sender_ip, sender_port = result
-                    msg = Message.deserialize(data)
-                    msg.sender_ip = sender_ip
-                    msg.sender_port = sender_port
-                    self._handle_incoming_message(msg)
-                
-            except Exception as e:
-                logger.error(f"Receive worker error: {e}")
-            
-            time.sleep(0.01)
+        with selectors.DefaultSelector() as selector:
+            selector.register(sock.socket, selectors.EVENT_READ)
+            while self._running:
+                try:
+                    # Wake regularly to notice stop()
+                    if selector.select(0.5):
+                        self._drain_data_socket(sock)
+                except Exception as e:
+                    logger.error(f"Receive worker error: {e}")
         
         logger.info("Receive worker stopped")
     
+    def _send_discovery(self):
+        """Broadcast a discovery message; responses are read by the IO worker."""
+        try:
+            discovery_msg = f"{NetworkConfig.APP_IDENTIFIER}:{self.data_socket.local_port}"
+            msg = Message(MessageType.DISCOVER, discovery_msg)
+            self.discovery_socket.broadcast(msg.serialize(), NetworkConfig.DISCOVERY_PORT)
+        except Exception as e:
+            logger.error(f"Discovery error: {e}")
+    
+    def _drain_data_socket(self, sock: UDPSocket):
+        """Receive and handle every datagram queued on one data-port socket."""
+        batch = sock.receive_batch()
+        while batch:
+            for data, sender_ip, sender_port in batch:
+                msg = Message.deserialize(data)
+                msg.sender_ip = sender_ip
+                msg.sender_port = sender_port
+                self._handle_incoming_message(msg)
+            batch = sock.receive_batch()
+    
+    def _drain_discovery_socket(self):
+        """Receive and handle every datagram queued on the discovery socket."""
+        result = self.discovery_socket.receive_from()
+        while result:
+            data, sender_ip, sender_port = result
+            self._handle_discovery_message(data, sender_ip)
+            result = self.discovery_socket.receive_from()
+    
     def _send_worker(self):
         """Worker thread for sending messages."""
         logger.info("Send worker started")
         
         while self._running:
             try:
-                msg = self.outgoing_messages.get(timeout=0.1)
-                serialized = msg.serialize()
-                self.data_socket.send_to(serialized, msg.sender_ip, msg.sender_port)
+                # Block for the first message, then take whatever else is queued
+                batch = [self.outgoing_messages.get(timeout=0.1)]
+                while len(batch) < self.SEND_BATCH_SIZE:
+                    try:
+                        batch.append(self.outgoing_messages.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                packets = []
+                for msg in batch:
+                    if isinstance(msg, Broadcast):
+                        packets.extend((msg.wire, addr, sockaddr) for addr, sockaddr in msg.dests)
+                    else:
+                        packets.append((msg.serialize(), (msg.sender_ip, msg.sender_port), None))
+                self.data_socket.send_batch(packets)
                 
             except queue.Empty:
                 continue
@@ -496,32 +989,36 @@ class NetworkManager:
         
         logger.info("Send worker stopped")
     
-    def _heartbeat_worker(self):
-        """Worker thread for sending heartbeats."""
-        logger.info("Heartbeat worker started")
-        
-        while self._running:
-            try:
+    def _heartbeat_tick(self):
+        """Check peers for timeouts and queue heartbeats to the live ones."""
+        try:
+            # Snapshot under the lock; checks and queueing happen outside it
+            with self._peers_lock:
+                connected = [peer_info for peer_info in self.peers.values()
+                             if peer_info.is_connected]
+            
+            now = time.monotonic()
+            timed_out = []
+            dests = []
+            for peer_info in connected:
+                if peer_info.is_timeout(now):
+                    timed_out.append(peer_info)
+                else:
+                    dests.append((peer_info.addr, peer_info.sockaddr))
+            
+            # One queued frame for all live peers
+            if dests:
+                self.outgoing_messages.put(Broadcast(_HEARTBEAT_WIRE, dests))
+            
+            if timed_out:
                 with self._peers_lock:
-                    # Check for timeouts and send heartbeats
-                    for peer_id, peer_info in list(self.peers.items()):
-                        if peer_info.is_connected:
-                            if peer_info.is_timeout():
-                                logger.warning(f"Peer timeout: {peer_id}")
-                                peer_info.is_connected = False
-                            else:
-                                # Send heartbeat
-                                heartbeat = Message(MessageType.HEARTBEAT, "")
-                                heartbeat.sender_ip = peer_info.ip_address
-                                heartbeat.sender_port = peer_info.port
-                                self.outgoing_messages.put(heartbeat)
-                
-            except Exception as e:
-                logger.error(f"Heartbeat worker error: {e}")
+                    for peer_info in timed_out:
+                        peer_info.is_connected = False
+                for peer_info in timed_out:
+                    logger.warning("Peer timeout: %s:%d", *peer_info.addr)
             
-            time.sleep(NetworkConfig.HEARTBEAT_INTERVAL_MS / 1000.0)
-        
-        logger.info("Heartbeat worker stopped")
+        except Exception as e:
+            logger.error(f"Heartbeat error: {e}")
     
     def _handle_discovery_message(self, data: bytes, sender_ip: str):
         """Handle discovery messages."""
@@ -533,15 +1030,15 @@ class NetworkManager:
                 parts = msg.payload.split(':')
                 if len(parts) >= 2:
                     peer_port = int(parts[-1])
-                    peer_id = f"{sender_ip}:{peer_port}"
+                    key = _peer_key(sender_ip, peer_port)
                     
                     with self._peers_lock:
                         # Check if peer is new
-                        if peer_id not in self.peers:
-                            logger.info(f"Discovered new peer: {peer_id}")
+                        if key not in self.peers:
+                            logger.info("Discovered new peer: %s:%d", sender_ip, peer_port)
                             
                             # Add peer
-                            self.peers[peer_id] = PeerInfo(sender_ip, peer_port)
+                            self.peers[key] = PeerInfo(sender_ip, peer_port)
                             
                             # Send acknowledge if this was a discovery message
                             if msg.type == MessageType.DISCOVER:
@@ -555,109 +1052,117 @@ class NetworkManager:
                                 self._initiate_handshake(sender_ip, peer_port)
                     
         except Exception as e:
-            logger.error(f"Error handling discovery message: {e}")
+            logger.error("Error handling discovery message: %s", e)
     
     def _handle_incoming_message(self, msg: Message):
         """Handle incoming data messages."""
-        peer_id = f"{msg.sender_ip}:{msg.sender_port}"
+        key = _peer_key(msg.sender_ip, msg.sender_port)
         
         # Update peer heartbeat
         with self._peers_lock:
-            if peer_id in self.peers:
-                self.peers[peer_id].update_heartbeat()
-        
-        # Process message based on type
-        if msg.type == MessageType.HANDSHAKE_START:
-            self._handle_handshake_start(msg)
-        elif msg.type == MessageType.HANDSHAKE_ACK:
-            self._handle_handshake_ack(msg)
-        elif msg.type == MessageType.HANDSHAKE_COMPLETE:
-            self._handle_handshake_complete(msg)
-        elif msg.type == MessageType.DATA:
-            # Add to incoming queue
-            self.incoming_messages.put(msg)
-            # Call custom handler if set
-            if self.message_handler:
-                try:
-                    self.message_handler(msg)
-                except Exception as e:
-                    logger.error(f"Message handler error: {e}")
-        elif msg.type == MessageType.HEARTBEAT:
-            # Heartbeat already handled above
-            pass
-        elif msg.type == MessageType.DISCONNECT:
-            self._handle_disconnect(msg)
+            peer_info = self.peers.get(key)
+            if peer_info:
+                peer_info.update_heartbeat()
+        
+        # Process message based on type; heartbeats need nothing beyond the
+        # update above, so they have no entry
+        handler = self._dispatch.get(msg.type)
+        if handler:
+            handler(msg)
+    
+    def _deliver_packed_data(self, msg: Message):
+        """Decode a msgpack data message and deliver it like a JSON one."""
+        if not HAVE_MSGPACK:
+            logger.warning("Dropping msgpack data from %s:%d: msgpack is not installed",
+                           msg.sender_ip, msg.sender_port)
+            return
+        try:
+            msg.data = msgpack.unpackb(msg.payload_bytes, raw=False)
+            if HAVE_ORJSON:
+                msg.payload = orjson.dumps(msg.data).decode('utf-8')
+            else:
+                msg.payload = json.dumps(msg.data)
+        except Exception as e:
+            logger.error("Failed to decode msgpack data: %s", e)
+            return
+        msg.type = MessageType.DATA
+        self._deliver_data(msg)
+    
+    def _deliver_data(self, msg: Message):
+        """Queue a data message and pass it to the custom handler."""
+        self.incoming_messages.put(msg)
+        
+        # Call custom handler if set
+        if self.message_handler:
+            try:
+                self.message_handler(msg)
+            except Exception as e:
+                logger.error("Message handler error: %s", e)
     
     def _initiate_handshake(self, ip: str, port: int):
         """Initiate handshake with peer."""
-        logger.info(f"Initiating handshake with {ip}:{port}")
+        logger.info("Initiating handshake with %s:%d", ip, port)
         
-        handshake = Message(MessageType.HANDSHAKE_START, NetworkConfig.PROTOCOL_VERSION)
-        handshake.sender_ip = ip
-        handshake.sender_port = port
-        self.outgoing_messages.put(handshake)
+        # Control frames bypass the outgoing queue; sendto is thread-safe
+        self.data_socket.send_to(_HANDSHAKE_START_WIRE, ip, port)
     
     def _handle_handshake_start(self, msg: Message):
         """Handle handshake start message."""
-        logger.info(f"Received handshake start from {msg.sender_ip}:{msg.sender_port}")
+        logger.info("Received handshake start from %s:%d", msg.sender_ip, msg.sender_port)
+        self._record_protocol_version(msg)
         
         # Send handshake acknowledgment
-        ack = Message(MessageType.HANDSHAKE_ACK, NetworkConfig.PROTOCOL_VERSION)
-        ack.sender_ip = msg.sender_ip
-        ack.sender_port = msg.sender_port
-        self.outgoing_messages.put(ack)
+        self.data_socket.send_to(_HANDSHAKE_ACK_WIRE, msg.sender_ip, msg.sender_port)
     
     def _handle_handshake_ack(self, msg: Message):
         """Handle handshake acknowledgment."""
-        logger.info(f"Received handshake ack from {msg.sender_ip}:{msg.sender_port}")
+        logger.info("Received handshake ack from %s:%d", msg.sender_ip, msg.sender_port)
+        self._record_protocol_version(msg)
         
         # Send handshake complete
-        complete = Message(MessageType.HANDSHAKE_COMPLETE, "")
-        complete.sender_ip = msg.sender_ip
-        complete.sender_port = msg.sender_port
-        self.outgoing_messages.put(complete)
+        self.data_socket.send_to(_HANDSHAKE_COMPLETE_WIRE, msg.sender_ip, msg.sender_port)
         
         # Mark peer as connected
         self._mark_peer_connected(msg.sender_ip, msg.sender_port)
     
     def _handle_handshake_complete(self, msg: Message):
         """Handle handshake complete message."""
-        logger.info(f"Handshake complete with {msg.sender_ip}:{msg.sender_port}")
+        logger.info("Handshake complete with %s:%d", msg.sender_ip, msg.sender_port)
         
         # Mark peer as connected
         self._mark_peer_connected(msg.sender_ip, msg.sender_port)
     
+    def _record_protocol_version(self, msg: Message):
+        """Remember the protocol version a peer sent in its handshake."""
+        with self._peers_lock:
+            peer_info = self.peers.get(_peer_key(msg.sender_ip, msg.sender_port))
+            if peer_info:
+                peer_info.protocol_version = msg.payload
+    
     def _mark_peer_connected(self, ip: str, port: int):
         """Mark peer as connected."""
-        peer_id = f"{ip}:{port}"
-        
         with self._peers_lock:
-            if peer_id in self.peers:
-                self.peers[peer_id].is_connected = True
-                self.peers[peer_id].update_heartbeat()
-                logger.info(f"Peer connected: {peer_id}")
+            peer_info = self.peers.get(_peer_key(ip, port))
+            if peer_info:
+                peer_info.is_connected = True
+                peer_info.update_heartbeat()
+                logger.info("Peer connected: %s:%d", *peer_info.addr)
     
     def _handle_disconnect(self, msg: Message):
         """Handle disconnect message."""
-        peer_id = f"{msg.sender_ip}:{msg.sender_port}"
-        
         with self._peers_lock:
-            if peer_id in self.peers:
-                del self.peers[peer_id]
+            self.peers.pop(_peer_key(msg.sender_ip, msg.sender_port), None)
         
-        logger.info(f"Peer disconnected: {peer_id}")
+        logger.info("Peer disconnected: %s:%d", msg.sender_ip, msg.sender_port)
     
     def _broadcast_disconnect(self):
         """Broadcast disconnect message to all peers."""
-        disconnect = Message(MessageType.DISCONNECT, "")
+        serialized = Message(MessageType.DISCONNECT).serialize()
         
         with self._peers_lock:
             for peer_info in self.peers.values():
                 if peer_info.is_connected:
-                    disconnect.sender_ip = peer_info.ip_address
-                    disconnect.sender_port = peer_info.port
-                    serialized = disconnect.serialize()
-                    self.data_socket.send_to(serialized, peer_info.ip_address, peer_info.port)
+                    self.data_socket.send_to(serialized, *peer_info.addr)
 
 
 class VRDataStreamer:
@@ -673,6 +1178,11 @@ class VRDataStreamer:
         self.vr_data_types = ['position', 'rotation', 'hand_tracking', 'eye_tracking']
         self.simulation_enabled = False
         
+        # Simulated packets reuse one dict, refilled from a private RNG
+        self._rng = random.Random()
+        self._sim_point = {'x': 0.0, 'y': 0.0, 'z': 0.0, 'confidence': 0.0}
+        self._sim_data = {'type': '', 'timestamp': 0, 'data': self._sim_point}
+        
     def start(self, enable_discovery: bool = True) -> bool:
         """
         Start the VR data streamer.
@@ -743,17 +1253,26 @@ class VRDataStreamer:
             data: VR data dictionary
         """
         try:
-            json_data = json.dumps(data)
-            self.network.broadcast_to_peers(json_data)
+            if HAVE_ORJSON:
+                payload = orjson.dumps(data)
+            else:
+                payload = json.dumps(data).encode('utf-8')
+            
+            self.network.broadcast_to_peers(payload, data)
         except Exception as e:
-            logger.error(f"Failed to send VR data: {e}")
+            logger.error("Failed to send VR data: %s", e)
     
     def _handle_vr_data(self, msg: Message):
         """Handle incoming VR data."""
         if msg.type == MessageType.DATA:
             try:
-                # Parse VR data (expecting JSON)
-                vr_data = json.loads(msg.payload)
+                # msgpack data from negotiated peers arrives already decoded
+                if msg.data is not None:
+                    vr_data = msg.data
+                elif HAVE_ORJSON:
+                    vr_data = orjson.loads(msg.payload)
+                else:
+                    vr_data = json.loads(msg.payload)
                 
                 # Log received data
                 data_type = vr_data.get('type', 'unknown')
@@ -761,7 +1280,11 @@ class VRDataStreamer:
                 
                 print(f"\n[VR Data from {msg.sender_ip}:{msg.sender_port}]")
                 print(f"  Type: {data_type}")
-                print(f"  Timestamp: {datetime.fromtimestamp(timestamp / 1e9) if timestamp else 'N/A'}")
+                # time.localtime/strftime avoid building a datetime per packet
+                if timestamp:
+                    print(f"  Timestamp: {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(timestamp / 1e9))}")
+                else:
+                    print("  Timestamp: N/A")
                 print(f"  Data: {vr_data.get('data', 'N/A')}")
                 
                 # Here you would process VR-specific data
@@ -771,24 +1294,21 @@ class VRDataStreamer:
                 # Handle non-JSON messages
                 print(f"\n[Message from {msg.sender_ip}:{msg.sender_port}] {msg.payload}")
             except Exception as e:
-                logger.error(f"Error handling VR data: {e}")
+                logger.error("Error handling VR data: %s", e)
     
     def _send_simulated_vr_data(self):
         """Send simulated VR data for testing."""
-        import random
+        rng = self._rng
+        point = self._sim_point
+        point['x'] = rng.uniform(-10, 10)
+        point['y'] = rng.uniform(-10, 10)
+        point['z'] = rng.uniform(-10, 10)
+        point['confidence'] = rng.uniform(0.8, 1.0)
+        self._sim_data['type'] = rng.choice(self.vr_data_types)
+        self._sim_data['timestamp'] = time.time_ns()
         
-        vr_data = {
-            'type': random.choice(self.vr_data_types),
-            'timestamp': time.time_ns(),
-            'data': {
-                'x': random.uniform(-10, 10),
-                'y': random.uniform(-10, 10),
-                'z': random.uniform(-10, 10),
-                'confidence': random.uniform(0.8, 1.0)
-            }
-        }
-        
-        self.send_vr_data(vr_data)
+        # Serialized synchronously, so the dict can be refilled next tick
+        self.send_vr_data(self._sim_data)
     
     def _input_worker(self):
         """Worker thread for handling user input."""
@@ -845,7 +1365,7 @@ class VRDataStreamer:
         if peers:
             for peer in peers:
                 print(f"  - {peer.ip_address}:{peer.port}")
-                print(f"    Last heartbeat: {datetime.fromtimestamp(peer.last_heartbeat)}")
+                print(f"    Last heartbeat: {time.monotonic() - peer.last_heartbeat:.1f} s ago")
         else:
             print("  No connected peers")
     
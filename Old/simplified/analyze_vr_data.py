@@ -10,9 +10,11 @@ Generates visualizations and statistics from CSV files.
 
 Requirements:
     pip install pandas matplotlib numpy
+    pip install pyarrow  (optional, faster CSV parsing)
+    pip install numba    (optional, compiled statistics kernel)
 
 Usage:
-    python analyze_vr_data.py <filename.csv>
+    python analyze_vr_data.py <filename.csv> [--stats-only]
 
 Example:
     python analyze_vr_data.py session_01.csv
@@ -23,14 +25,146 @@ v1.0 - 04 November 2025 - Initial implementation
   - Position and rotation trajectory plotting
   - Movement statistics calculation
   - Distance and velocity analysis
+v1.1 - 15 October 2026 - Analysis performance pass
+  - Single-pass distance/velocity kernel shared by plots and statistics
+  - Positions extracted once into a dense (N, 3, 3) float32 block
+  - Pose columns parsed as float32 at load time
+  - CSV parsed with pyarrow when available; rotation columns skipped
+  - Numba-compiled distance/velocity kernel when numba is installed
+  - 3D trajectories drawn as segment collections on a single shared axis
+  - Plotted lines strided to at most 5000 points with path simplification
+  - Position time series drawn as LineCollections on shared axes
+  - Long sessions plotted concurrently in worker processes via shared memory
+  - Agg backend forced; 3D trajectories saved at 150 dpi
+  - Distance/velocity statistics vectorized across all tracked objects
+  - Segment lengths computed in a single preallocated buffer
+  - Numba kernel processes all objects in one GIL-free call
+  - --stats-only/--no-plots flag; matplotlib imported only when plotting
+  - Plots index per-object views of the position block
+  - Figures created outside pyplot and reusable across plot calls
+  - Max velocity from squared ratios; velocity array skipped in --stats-only
+  - Statistics report built once and written in a single call
+  - Fixed subplot margins instead of a tight_layout pass per figure
+  - Session duration and record count computed once at load time
 """
 
+import os
 import sys
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+# Numba is optional; without it the NumPy path in calc_distance_and_velocity is used
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Tracked objects in the order they are stored in the position block
+OBJECTS = ['Head', 'LeftHand', 'RightHand']
+POSITION_COLUMNS = [f'{obj}Pos{axis}' for obj in OBJECTS for axis in 'XYZ']
+
+# Only timestamps and positions are analysed; rotation columns are never parsed.
+# Positions go straight to float32 (cm precision needs no more)
+USED_COLUMNS = ['Timestamp'] + POSITION_COLUMNS
+COLUMN_DTYPES = {'Timestamp': np.int64}
+COLUMN_DTYPES.update({col: np.float32 for col in POSITION_COLUMNS})
+
+# Upper bound on points per plotted line
+MAX_PLOT_POINTS = 5000
+
+# Sessions with fewer samples are plotted in-process; below this, starting
+# the worker processes costs more than drawing the three plots in turn
+PARALLEL_PLOT_MIN_SAMPLES = 50_000
+
+# Fixed subplot margins; figure sizes never change, so no tight_layout pass
+PLOT_MARGINS = dict(left=0.08, right=0.98, bottom=0.08, top=0.93,
+                    wspace=0.28, hspace=0.28)
+
+def plot_stride(n_samples):
+    """
+    Get the sample stride that keeps plotted lines under MAX_PLOT_POINTS
+    
+    Args:
+        n_samples (int): Number of samples in the session
+        
+    Returns:
+        int: Stride (1 when no downsampling is needed)
+    """
+    return max(1, n_samples // MAX_PLOT_POINTS)
+
+_matplotlib_ready = False
+
+def _init_matplotlib():
+    """
+    Import and configure matplotlib once per process
+    
+    matplotlib is only imported when a plot is drawn, so --stats-only runs
+    never pay its import time.
+    """
+    global _matplotlib_ready
+    if _matplotlib_ready:
+        return
+    
+    import matplotlib
+    matplotlib.use('Agg')  # Plots are only saved to PNG; skip GUI backend setup
+    
+    # Let Agg simplify dense paths; sub-mm jitter is invisible at plot resolution
+    matplotlib.rcParams.update({
+        'path.simplify': True,
+        'path.simplify_threshold': 1.0,
+        'agg.path.chunksize': 10000,
+        'axes.grid': True,
+        'grid.alpha': 0.3,
+    })
+    _matplotlib_ready = True
+
+def _figure(fig, figsize):
+    """
+    Get an empty figure for a plot, reusing fig when one is passed in
+    
+    Figures are created directly rather than through pyplot, so they are
+    never tracked by pyplot's figure registry.
+    
+    Args:
+        fig (matplotlib.figure.Figure): Figure to clear and reuse, or None
+        figsize (tuple): Figure size in inches
+        
+    Returns:
+        matplotlib.figure.Figure: Empty figure of the requested size
+    """
+    _init_matplotlib()
+    from matplotlib.figure import Figure
+    
+    if fig is None:
+        return Figure(figsize=figsize)
+    fig.clear()
+    fig.set_size_inches(figsize)
+    return fig
+
+def _read_csv(filename):
+    """
+    Read the used CSV columns, preferring the multi-threaded pyarrow parser
+    
+    Args:
+        filename (str): Path to CSV file
+        
+    Returns:
+        pandas.DataFrame: Timestamp and position columns
+    """
+    try:
+        return pd.read_csv(filename, engine='pyarrow',
+                           usecols=USED_COLUMNS, dtype=COLUMN_DTYPES)
+    except ImportError:
+        # pyarrow is optional; fall back to the C parser
+        return pd.read_csv(filename, engine='c', memory_map=True, low_memory=False,
+                           usecols=USED_COLUMNS, dtype=COLUMN_DTYPES)
+
 def load_vr_data(filename):
     """
     Load VR tracking data from CSV file
@@ -39,247 +173,447 @@ def load_vr_data(filename):
         filename (str): Path to CSV file
         
     Returns:
-        pandas.DataFrame: Loaded VR data
+        pandas.DataFrame: Loaded VR data, with 'duration_s', 'n_records' and
+                          'sampling_rate_hz' cached in df.attrs
     """
     try:
-        df = pd.read_csv(filename)
+        df = _read_csv(filename)
+        
+        # Session length from the latest timestamp; rows are not assumed sorted
+        duration_s = float(df['Timestamp'].max()) / 1000
+        n_records = len(df)
+        # A zero-length session (one row, or all timestamps 0) has no finite rate
+        sampling_rate_hz = n_records / duration_s if duration_s > 0 else float('inf')
+        df.attrs.update(duration_s=duration_s, n_records=n_records,
+                        sampling_rate_hz=sampling_rate_hz)
+        
         print(f"✓ Loaded {filename}")
-        print(f"  - Records: {len(df)}")
-        print(f"  - Duration: {df['Timestamp'].max() / 1000:.2f} seconds")
-        print(f"  - Sampling rate: {len(df) / (df['Timestamp'].max() / 1000):.1f} Hz")
+        print(f"  - Records: {n_records}")
+        print(f"  - Duration: {duration_s:.2f} seconds")
+        print(f"  - Sampling rate: {sampling_rate_hz:.1f} Hz")
         return df
     except Exception as e:
         print(f"✗ Error loading file: {e}")
         sys.exit(1)
 
-def calculate_distance(df, prefix):
+def extract_positions(df):
     """
-    Calculate total distance traveled for a tracked object
+    Extract tracked positions into a dense NumPy block
     
     Args:
         df (pandas.DataFrame): VR data
-        prefix (str): Column prefix (Head, LeftHand, RightHand)
         
     Returns:
-        float: Total distance in meters
+        tuple: (positions, time_s) where positions is a float32 array of
+               shape (N, 3, 3) indexed as [sample, object, axis] and time_s
+               holds the sample times in seconds
     """
-    x = df[f'{prefix}PosX'].values
-    y = df[f'{prefix}PosY'].values
-    z = df[f'{prefix}PosZ'].values
-    
-    # Calculate distance between consecutive points
-    dx = np.diff(x)
-    dy = np.diff(y)
-    dz = np.diff(z)
-    
-    distances = np.sqrt(dx**2 + dy**2 + dz**2)
-    return np.sum(distances)
+    positions = df[POSITION_COLUMNS].to_numpy(dtype=np.float32).reshape(-1, 3, 3)
+    # Times stay in float64: float32 seconds lose sub-ms resolution on long sessions
+    time_s = df['Timestamp'].to_numpy(dtype=np.float64) * 1e-3
+    return positions, time_s
 
-def calculate_velocity(df, prefix):
+def object_tracks(positions):
     """
-    Calculate average velocity for a tracked object
+    Split the position block into per-object views
     
     Args:
-        df (pandas.DataFrame): VR data
-        prefix (str): Column prefix (Head, LeftHand, RightHand)
+        positions (numpy.ndarray): (N, 3, 3) position block
         
     Returns:
-        tuple: (mean_velocity, max_velocity) in m/s
+        dict: Object name -> (N, 3) zero-copy view of its positions
     """
-    x = df[f'{prefix}PosX'].values
-    y = df[f'{prefix}PosY'].values
-    z = df[f'{prefix}PosZ'].values
-    timestamps = df['Timestamp'].values / 1000.0  # Convert to seconds
-    
-    # Calculate distance between consecutive points
-    dx = np.diff(x)
-    dy = np.diff(y)
-    dz = np.diff(z)
-    dt = np.diff(timestamps)
+    return {obj: positions[:, i, :] for i, obj in enumerate(OBJECTS)}
+
+if HAVE_NUMBA:
+    @njit(inline='always')
+    def _segment_length(positions, i, k):
+        """Length of segment i of tracked object k"""
+        dx = positions[i + 1, k, 0] - positions[i, k, 0]
+        dy = positions[i + 1, k, 1] - positions[i, k, 1]
+        dz = positions[i + 1, k, 2] - positions[i, k, 2]
+        return np.sqrt(dx * dx + dy * dy + dz * dz)
+    
+    @njit(fastmath=True, cache=True, parallel=True, nogil=True)
+    def _dist_vel_kernel(positions, time_s, velocities, results):
+        """
+        Compiled distance/velocity loop over the whole position block
+        
+        The three tracked objects are unrolled so every sample row is read
+        once, and all reductions stay in registers. Runs without the GIL.
+        
+        Args:
+            positions (numpy.ndarray): (N, 3, 3) position block
+            time_s (numpy.ndarray): Sample times in seconds
+            velocities (numpy.ndarray): (N-1, 3) output for per-sample velocity,
+                                        or an empty array to skip storing it
+            results (numpy.ndarray): (3, 3) output; rows are total distance,
+                                     mean velocity and max velocity per object
+        """
+        n = positions.shape[0] - 1
+        store = velocities.shape[0] > 0
+        dist0 = 0.0
+        dist1 = 0.0
+        dist2 = 0.0
+        vel0 = 0.0
+        vel1 = 0.0
+        vel2 = 0.0
+        max0 = 0.0
+        max1 = 0.0
+        max2 = 0.0
+        for i in prange(n):
+            inv_dt = 1.0 / (time_s[i + 1] - time_s[i])
+            seg0 = _segment_length(positions, i, 0)
+            seg1 = _segment_length(positions, i, 1)
+            seg2 = _segment_length(positions, i, 2)
+            v0 = seg0 * inv_dt
+            v1 = seg1 * inv_dt
+            v2 = seg2 * inv_dt
+            if store:
+                velocities[i, 0] = v0
+                velocities[i, 1] = v1
+                velocities[i, 2] = v2
+            dist0 += seg0
+            dist1 += seg1
+            dist2 += seg2
+            vel0 += v0
+            vel1 += v1
+            vel2 += v2
+            max0 = max(max0, v0)
+            max1 = max(max1, v1)
+            max2 = max(max2, v2)
+        results[0, 0] = dist0
+        results[0, 1] = dist1
+        results[0, 2] = dist2
+        # A single-sample session has no segments and zero velocity
+        inv_n = 1.0 / n if n > 0 else 0.0
+        results[1, 0] = vel0 * inv_n
+        results[1, 1] = vel1 * inv_n
+        results[1, 2] = vel2 * inv_n
+        results[2, 0] = max0
+        results[2, 1] = max1
+        results[2, 2] = max2
+
+def calc_distance_and_velocity(positions, time_s, with_velocities=True):
+    """
+    Calculate distance and velocity statistics for all tracked objects at once
     
-    distances = np.sqrt(dx**2 + dy**2 + dz**2)
-    velocities = distances / dt
+    Position differences and segment lengths are computed once and shared
+    between the distance and velocity results.
     
-    return np.mean(velocities), np.max(velocities)
+    Args:
+        positions (numpy.ndarray): (N, 3, 3) position block
+        time_s (numpy.ndarray): Sample times in seconds
+        with_velocities (bool): Also return the per-sample velocity array
+        
+    Returns:
+        tuple: (total_distance, mean_velocity, max_velocity, velocities) where
+               the first three are 3-vectors aligned with OBJECTS (m, m/s) and
+               velocities is the (N-1, 3) per-sample velocity array for plotting
+               (None when with_velocities is False)
+    """
+    n_segments = len(positions) - 1 if with_velocities else 0
+    if HAVE_NUMBA:
+        velocities = np.empty((n_segments, 3), dtype=np.float64)
+        results = np.empty((3, 3), dtype=np.float64)
+        _dist_vel_kernel(positions, time_s, velocities, results)
+        total, mean_vel, max_vel = results
+        return total, mean_vel, max_vel, velocities if with_velocities else None
+    
+    if len(positions) < 2:
+        # A single-sample session has no segments and zero velocity
+        zeros = np.zeros(3, dtype=np.float64)
+        velocities = np.empty((0, 3), dtype=np.float64) if with_velocities else None
+        return zeros, zeros.copy(), zeros.copy(), velocities
+    
+    # Squared segment lengths, broadcast over the object axis
+    diffs = np.diff(positions, axis=0)
+    sq_lengths = np.empty(diffs.shape[:2], dtype=diffs.dtype)
+    np.einsum('ijk,ijk->ij', diffs, diffs, out=sq_lengths)
+    distances = np.sqrt(sq_lengths)
+    inv_dt = 1.0 / np.diff(time_s)
+    
+    # Accumulate in float64; strided float32 sums drift over long sessions
+    total = distances.sum(axis=0, dtype=np.float64)
+    mean_vel = np.einsum('ij,i->j', distances, inv_dt, dtype=np.float64) / len(inv_dt)
+    
+    # sqrt is monotonic, so take the max on squared velocities and root once.
+    # Results are float64 like the Numba kernel's, whatever the input dtype
+    sq_lengths *= (inv_dt * inv_dt)[:, None]
+    max_vel = np.sqrt(sq_lengths.max(axis=0), dtype=np.float64)
+    
+    velocities = distances * inv_dt[:, None] if with_velocities else None
+    return total, mean_vel, max_vel, velocities
 
-def plot_trajectories(df, output_dir):
+def plot_trajectories(positions, output_dir, fig=None):
     """
     Plot 3D trajectories of head and controllers
     
     Args:
-        df (pandas.DataFrame): VR data
+        positions (numpy.ndarray): (N, 3, 3) position block
         output_dir (Path): Directory to save plots
+        fig (matplotlib.figure.Figure): Optional figure to reuse
+        
+    Returns:
+        matplotlib.figure.Figure: The figure drawn on, for reuse by later plots
     """
-    fig = plt.figure(figsize=(15, 5))
-    
-    # Head trajectory
-    ax1 = fig.add_subplot(131, projection='3d')
-    ax1.plot(df['HeadPosX'], df['HeadPosY'], df['HeadPosZ'], 
-             label='Head', color='blue', alpha=0.6)
-    ax1.set_xlabel('X (m)')
-    ax1.set_ylabel('Y (m)')
-    ax1.set_zlabel('Z (m)')
-    ax1.set_title('Head Trajectory')
-    ax1.legend()
-    
-    # Left hand trajectory
-    ax2 = fig.add_subplot(132, projection='3d')
-    ax2.plot(df['LeftHandPosX'], df['LeftHandPosY'], df['LeftHandPosZ'], 
-             label='Left Hand', color='green', alpha=0.6)
-    ax2.set_xlabel('X (m)')
-    ax2.set_ylabel('Y (m)')
-    ax2.set_zlabel('Z (m)')
-    ax2.set_title('Left Hand Trajectory')
-    ax2.legend()
-    
-    # Right hand trajectory
-    ax3 = fig.add_subplot(133, projection='3d')
-    ax3.plot(df['RightHandPosX'], df['RightHandPosY'], df['RightHandPosZ'], 
-             label='Right Hand', color='red', alpha=0.6)
-    ax3.set_xlabel('X (m)')
-    ax3.set_ylabel('Y (m)')
-    ax3.set_zlabel('Z (m)')
-    ax3.set_title('Right Hand Trajectory')
-    ax3.legend()
-    
-    plt.tight_layout()
+    fig = _figure(fig, (10, 8))
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+    
+    positions = positions[::plot_stride(len(positions))]
+    tracks = object_tracks(positions)
+    
+    ax = fig.add_subplot(111, projection='3d')
+    
+    labels = ['Head', 'Left Hand', 'Right Hand']
+    colors = ['blue', 'green', 'red']
+    
+    # One segment collection per object on a shared 3D axis
+    for obj, label, color in zip(OBJECTS, labels, colors):
+        track = tracks[obj]
+        if len(track) < 2:
+            # A single sample has no segments; mark its position instead
+            ax.scatter(*track.T, color=color, alpha=0.6, label=label)
+            continue
+        segments = np.stack([track[:-1], track[1:]], axis=1)
+        ax.add_collection3d(Line3DCollection(segments, colors=color,
+                                             alpha=0.6, label=label))
+    
+    # Collections do not autoscale, so set limits from the data
+    lo = positions.min(axis=(0, 1))
+    hi = positions.max(axis=(0, 1))
+    ax.auto_scale_xyz([lo[0], hi[0]], [lo[1], hi[1]], [lo[2], hi[2]])
+    
+    ax.set_xlabel('X (m)')
+    ax.set_ylabel('Y (m)')
+    ax.set_zlabel('Z (m)')
+    ax.set_title('Head and Hand Trajectories')
+    ax.legend()
+    
+    fig.subplots_adjust(**PLOT_MARGINS)
     output_file = output_dir / 'trajectories_3d.png'
-    plt.savefig(output_file, dpi=300)
+    fig.savefig(output_file, dpi=150)
     print(f"✓ Saved 3D trajectories to {output_file}")
-    plt.close()
+    return fig
 
-def plot_position_over_time(df, output_dir):
+def plot_position_over_time(positions, time_s, output_dir, fig=None):
     """
     Plot position components over time
     
     Args:
-        df (pandas.DataFrame): VR data
+        positions (numpy.ndarray): (N, 3, 3) position block
+        time_s (numpy.ndarray): Sample times in seconds
         output_dir (Path): Directory to save plots
+        fig (matplotlib.figure.Figure): Optional figure to reuse
+        
+    Returns:
+        matplotlib.figure.Figure: The figure drawn on, for reuse by later plots
     """
-    time_seconds = df['Timestamp'] / 1000.0
+    fig = _figure(fig, (15, 12))
+    from matplotlib.collections import LineCollection
+    
+    stride = plot_stride(len(time_s))
+    tracks = object_tracks(positions[::stride])
+    time_s = time_s[::stride]
     
-    fig, axes = plt.subplots(3, 3, figsize=(15, 12))
+    axes = fig.subplots(3, 3, sharex=True, sharey='row')
     
-    objects = ['Head', 'LeftHand', 'RightHand']
     colors = ['blue', 'green', 'red']
     
-    for i, (obj, color) in enumerate(zip(objects, colors)):
-        # X position
-        axes[i, 0].plot(time_seconds, df[f'{obj}PosX'], color=color, alpha=0.7)
-        axes[i, 0].set_ylabel(f'{obj} X (m)')
-        axes[i, 0].grid(True, alpha=0.3)
-        
-        # Y position
-        axes[i, 1].plot(time_seconds, df[f'{obj}PosY'], color=color, alpha=0.7)
-        axes[i, 1].set_ylabel(f'{obj} Y (m)')
-        axes[i, 1].grid(True, alpha=0.3)
+    for i, (obj, color) in enumerate(zip(OBJECTS, colors)):
+        track = tracks[obj]
+        for j, (axis, values) in enumerate(zip('XYZ', track.T)):
+            line = np.column_stack([time_s, values])[None, ...]
+            axes[i, j].add_collection(LineCollection(line, colors=color, alpha=0.7))
+            axes[i, j].set_ylabel(f'{obj} {axis} (m)')
         
-        # Z position
-        axes[i, 2].plot(time_seconds, df[f'{obj}PosZ'], color=color, alpha=0.7)
-        axes[i, 2].set_ylabel(f'{obj} Z (m)')
-        axes[i, 2].grid(True, alpha=0.3)
+        # Rows share y, so one limit per tracked object covers all three axes.
+        # A constant track (e.g. a single sample) is left to autoscaling,
+        # which widens the degenerate range instead of warning
+        lo, hi = track.min(), track.max()
+        if hi > lo:
+            axes[i, 0].set_ylim(lo, hi)
+        else:
+            axes[i, 0].autoscale_view(scalex=False)
+    
+    if time_s[-1] > time_s[0]:
+        axes[0, 0].set_xlim(time_s[0], time_s[-1])
+    else:
+        axes[0, 0].autoscale_view(scaley=False)
     
     for ax in axes[2, :]:
         ax.set_xlabel('Time (s)')
     
-    plt.suptitle('Position Components Over Time', fontsize=16)
-    plt.tight_layout()
+    fig.suptitle('Position Components Over Time', fontsize=16)
+    fig.subplots_adjust(**{**PLOT_MARGINS, 'hspace': 0.35})
     output_file = output_dir / 'position_time_series.png'
-    plt.savefig(output_file, dpi=300)
+    fig.savefig(output_file, dpi=300)
     print(f"✓ Saved position time series to {output_file}")
-    plt.close()
+    return fig
 
-def plot_velocity_over_time(df, output_dir):
+def plot_velocity_over_time(time_s, velocities, output_dir, fig=None):
     """
     Plot velocity magnitude over time
     
     Args:
-        df (pandas.DataFrame): VR data
+        time_s (numpy.ndarray): Sample times in seconds
+        velocities (numpy.ndarray): (N-1, 3) per-sample velocity array from
+                                    calc_distance_and_velocity
         output_dir (Path): Directory to save plots
+        fig (matplotlib.figure.Figure): Optional figure to reuse
+        
+    Returns:
+        matplotlib.figure.Figure: The figure drawn on, for reuse by later plots
     """
-    time_seconds = df['Timestamp'].values / 1000.0
+    fig = _figure(fig, (12, 10))
+    stride = plot_stride(len(time_s))
     
-    fig, axes = plt.subplots(3, 1, figsize=(12, 10))
+    axes = fig.subplots(3, 1)
     
-    objects = ['Head', 'LeftHand', 'RightHand']
     colors = ['blue', 'green', 'red']
     
-    for i, (obj, color) in enumerate(zip(objects, colors)):
-        # Calculate velocity magnitude
-        x = df[f'{obj}PosX'].values
-        y = df[f'{obj}PosY'].values
-        z = df[f'{obj}PosZ'].values
+    for i, (obj, color) in enumerate(zip(OBJECTS, colors)):
+        # Reuse the velocity magnitude computed for the statistics
+        velocity = velocities[::stride, i]
         
-        dx = np.diff(x)
-        dy = np.diff(y)
-        dz = np.diff(z)
-        dt = np.diff(time_seconds)
-        
-        velocity = np.sqrt(dx**2 + dy**2 + dz**2) / dt
-        
-        axes[i].plot(time_seconds[1:], velocity, color=color, alpha=0.7)
+        axes[i].plot(time_s[1::stride], velocity, color=color, alpha=0.7)
         axes[i].set_ylabel(f'{obj} Velocity (m/s)')
         axes[i].set_xlabel('Time (s)')
-        axes[i].grid(True, alpha=0.3)
         axes[i].set_title(f'{obj} Velocity')
     
-    plt.tight_layout()
+    # Every panel has its own title and x label, so leave room between rows
+    fig.subplots_adjust(**{**PLOT_MARGINS, 'hspace': 0.45})
     output_file = output_dir / 'velocity_time_series.png'
-    plt.savefig(output_file, dpi=300)
+    fig.savefig(output_file, dpi=300)
     print(f"✓ Saved velocity time series to {output_file}")
-    plt.close()
+    return fig
+
+def _shared_array(shm, offset, shape, dtype):
+    """
+    View an array stored in a shared memory segment
+    
+    Args:
+        shm (SharedMemory): Segment holding the array
+        offset (int): Byte offset of the array in the segment
+        shape (tuple): Array shape
+        dtype (str): Array element type
+        
+    Returns:
+        numpy.ndarray: Zero-copy view of the array
+    """
+    return np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
 
-def generate_statistics(df, output_dir):
+def _plot_from_shared(plot_func, shm_name, layout, names, output_dir):
+    """
+    Run a plot function in a worker on arrays held in shared memory
+    
+    Args:
+        plot_func (callable): Plot function taking the named arrays, then output_dir
+        shm_name (str): Name of the shared memory segment
+        layout (dict): Array name -> (offset, shape, dtype) within the segment
+        names (tuple): Names of the arrays to pass, in argument order
+        output_dir (Path): Directory to save plots
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        arrays = [_shared_array(shm, *layout[name]) for name in names]
+        plot_func(*arrays, output_dir)
+        del arrays
+    finally:
+        shm.close()
+
+def render_plots(positions, time_s, velocities, output_dir):
+    """
+    Render the three plots, concurrently in worker processes for long sessions
+    
+    Short sessions (or single-CPU machines) are plotted in-process. Otherwise
+    the positions, times and velocities are shared with the workers through
+    one shared memory segment instead of being pickled into each of them.
+    
+    Args:
+        positions (numpy.ndarray): (N, 3, 3) position block
+        time_s (numpy.ndarray): Sample times in seconds
+        velocities (numpy.ndarray): (N-1, 3) per-sample velocity array
+        output_dir (Path): Directory to save plots
+    """
+    if len(positions) < PARALLEL_PLOT_MIN_SAMPLES or (os.cpu_count() or 1) < 2:
+        # One figure is cleared and reused for all three plots
+        fig = plot_trajectories(positions, output_dir)
+        plot_position_over_time(positions, time_s, output_dir, fig)
+        plot_velocity_over_time(time_s, velocities, output_dir, fig)
+        return
+    
+    # Pack the arrays back to back, each 8-byte aligned
+    arrays = {'positions': positions, 'time_s': time_s, 'velocities': velocities}
+    layout = {}
+    size = 0
+    for name, array in arrays.items():
+        layout[name] = (size, array.shape, array.dtype.str)
+        size += -(-array.nbytes // 8) * 8
+    
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        for name, array in arrays.items():
+            _shared_array(shm, *layout[name])[...] = array
+        
+        # spawn, not fork: forking after the parallel Numba kernel has started
+        # its OpenMP threads leaves the workers unable to exit cleanly
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=3, mp_context=context) as executor:
+            jobs = [
+                executor.submit(_plot_from_shared, plot_trajectories, shm.name, layout,
+                                ('positions',), output_dir),
+                executor.submit(_plot_from_shared, plot_position_over_time, shm.name, layout,
+                                ('positions', 'time_s'), output_dir),
+                executor.submit(_plot_from_shared, plot_velocity_over_time, shm.name, layout,
+                                ('time_s', 'velocities'), output_dir),
+            ]
+            for job in jobs:
+                job.result()
+    finally:
+        shm.close()
+        shm.unlink()
+
+def generate_statistics(session, motion, output_dir):
     """
     Generate and save statistical summary
     
     Args:
-        df (pandas.DataFrame): VR data
+        session (dict): Session info cached by load_vr_data (df.attrs)
+        motion (tuple): Result of calc_distance_and_velocity
         output_dir (Path): Directory to save report
     """
     stats = {}
     
     # Calculate statistics for each tracked object
-    for obj in ['Head', 'LeftHand', 'RightHand']:
-        distance = calculate_distance(df, obj)
-        mean_vel, max_vel = calculate_velocity(df, obj)
-        
+    total_dist, mean_vel, max_vel, _ = motion
+    for i, obj in enumerate(OBJECTS):
         stats[obj] = {
-            'Total Distance': f"{distance:.3f} m",
-            'Mean Velocity': f"{mean_vel:.3f} m/s",
-            'Max Velocity': f"{max_vel:.3f} m/s"
+            'Total Distance': f"{total_dist[i]:.3f} m",
+            'Mean Velocity': f"{mean_vel[i]:.3f} m/s",
+            'Max Velocity': f"{max_vel[i]:.3f} m/s"
         }
     
     # Session statistics
-    duration = df['Timestamp'].max() / 1000.0
+    duration = session['duration_s']
+    n_records = session['n_records']
     stats['Session'] = {
         'Duration': f"{duration:.2f} s",
-        'Total Records': len(df),
-        'Sampling Rate': f"{len(df) / duration:.1f} Hz"
+        'Total Records': n_records,
+        'Sampling Rate': f"{session['sampling_rate_hz']:.1f} Hz"
     }
     
-    # Print statistics
-    print("\n" + "="*50)
-    print("VR TRACKING STATISTICS")
-    print("="*50)
-    
+    # Build the report once, then print and save it in single calls
+    lines = ["="*50, "VR TRACKING STATISTICS", "="*50]
     for category, metrics in stats.items():
-        print(f"\n{category}:")
-        for metric, value in metrics.items():
-            print(f"  {metric:20s}: {value}")
+        lines.append(f"\n{category}:")
+        lines.extend(f"  {metric:20s}: {value}" for metric, value in metrics.items())
+    text = "\n".join(lines)
+    
+    print("\n" + text)
     
-    # Save to file
     output_file = output_dir / 'statistics.txt'
-    with open(output_file, 'w') as f:
-        f.write("="*50 + "\n")
-        f.write("VR TRACKING STATISTICS\n")
-        f.write("="*50 + "\n\n")
-        
-        for category, metrics in stats.items():
-            f.write(f"{category}:\n")
-            for metric, value in metrics.items():
-                f.write(f"  {metric:20s}: {value}\n")
-            f.write("\n")
+    output_file.write_text(text + "\n\n")
     
     print(f"\n✓ Saved statistics to {output_file}")
 
@@ -290,19 +624,28 @@ def main():
     print("Author: Pi Ko (pi.ko@nyu.edu)")
     print("="*50 + "\n")
     
-    # Check command line arguments
-    if len(sys.argv) != 2:
-        print("Usage: python analyze_vr_data.py <filename.csv>")
-        print("Example: python analyze_vr_data.py session_01.csv")
-        sys.exit(1)
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(
+        description='Analyze VR tracking data recorded by the AIMLAB console',
+        epilog='Example: python analyze_vr_data.py session_01.csv'
+    )
+    parser.add_argument('filename', help='CSV file to analyze')
+    parser.add_argument(
+        '--stats-only', '--no-plots',
+        dest='stats_only',
+        action='store_true',
+        help='Only compute statistics; skip all plots'
+    )
+    args = parser.parse_args()
     
     # Load data
-    filename = sys.argv[1]
+    filename = args.filename
     if not Path(filename).exists():
         print(f"✗ File not found: {filename}")
         sys.exit(1)
     
     df = load_vr_data(filename)
+    positions, time_s = extract_positions(df)
     
     # Create output directory
     output_dir = Path(filename).stem + "_analysis"
@@ -310,14 +653,17 @@ def main():
     output_dir.mkdir(exist_ok=True)
     print(f"\n✓ Created output directory: {output_dir}")
     
+    # Compute distance/velocity once for both plots and statistics
+    motion = calc_distance_and_velocity(positions, time_s,
+                                        with_velocities=not args.stats_only)
+    
     # Generate visualizations
-    print("\nGenerating visualizations...")
-    plot_trajectories(df, output_dir)
-    plot_position_over_time(df, output_dir)
-    plot_velocity_over_time(df, output_dir)
+    if not args.stats_only:
+        print("\nGenerating visualizations...")
+        render_plots(positions, time_s, motion[3], output_dir)
     
     # Generate statistics
-    generate_statistics(df, output_dir)
+    generate_statistics(df.attrs, motion, output_dir)
     
     print("\n" + "="*50)
     print("Analysis complete!")
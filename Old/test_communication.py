@@ -7,63 +7,758 @@ It can send various types of test data and verify bidirectional communication.
 """
 
 import socket
+import struct
 import json
 import time
 import sys
+import os
+import errno
+import functools
 import argparse
 import random
 import threading
-from typing import List, Dict, Any
+import queue
+import ctypes
+import ctypes.util
+from collections import deque
+from typing import List, Dict, Any, Tuple, Union, Optional, Sequence, Callable
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+try:
+    import msgspec
+    HAVE_MSGSPEC = True
+except ImportError:
+    HAVE_MSGSPEC = False
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:
+    HAVE_NUMPY = False
+
+# Numba is optional; without it binary stress records are packed one at a
+# time with struct
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+# sendmmsg(2) hands a whole batch of datagrams to the kernel in one syscall
+# (Linux only; elsewhere send_message falls back to one sendto per message)
+class _IOVec(ctypes.Structure):
+    _fields_ = [('iov_base', ctypes.c_void_p), ('iov_len', ctypes.c_size_t)]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [('msg_name', ctypes.c_void_p), ('msg_namelen', ctypes.c_uint32),
+                ('msg_iov', ctypes.POINTER(_IOVec)), ('msg_iovlen', ctypes.c_size_t),
+                ('msg_control', ctypes.c_void_p), ('msg_controllen', ctypes.c_size_t),
+                ('msg_flags', ctypes.c_int)]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [('msg_hdr', _MsgHdr), ('msg_len', ctypes.c_uint)]
+
+
+_libc_sendmmsg = None
+if sys.platform.startswith('linux'):
+    try:
+        _libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        _libc_sendmmsg = _libc.sendmmsg
+        _libc_sendmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p,
+                                   ctypes.c_uint, ctypes.c_int]
+        _libc_sendmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _libc_sendmmsg = None
+
+# struct sockaddr_in starts with sa_family in host byte order
+_AF_INET_NATIVE = struct.pack('=H', socket.AF_INET)
+
+# MSG_ZEROCOPY sends (Linux 5.0+ for UDP); completions arrive on the socket
+# error queue as struct sock_extended_err covering a range of send calls
+_SO_ZEROCOPY = getattr(socket, 'SO_ZEROCOPY', 60)
+_MSG_ZEROCOPY = 0x4000000
+_SO_EE_ORIGIN_ZEROCOPY = 5
+_SO_EE_CODE_ZEROCOPY_COPIED = 1
+_SOCK_EXTENDED_ERR = struct.Struct('=IBBBBII')
+
+# Let the kernel fragment instead of probing the path MTU (Linux values;
+# the socket module does not export them)
+_IP_MTU_DISCOVER = getattr(socket, 'IP_MTU_DISCOVER', 10)
+_IP_PMTUDISC_DONT = getattr(socket, 'IP_PMTUDISC_DONT', 0)
+
+# Send buffer requested for test sockets; the kernel caps it at
+# net.core.wmem_max
+_SEND_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Wire prefix ("<type>|") of every message type the protocol defines, so
+# framing never formats the type number
+_TYPE_PREFIX = {msg_type: b"%d|" % msg_type for msg_type in range(10)}
+
+# Optional binary records (--binary) for the fixed-schema numeric samples,
+# sent after the usual b"5|" prefix in place of JSON. The leading tag byte
+# tells a receiver which layout to unpack; all fields are little-endian and
+# timestamps are time.time_ns() values. Receivers that only understand JSON
+# (the default) must not be sent these.
+_TAG_HEAD_POSITION = 1
+_TAG_HEAD_ROTATION = 2
+_TAG_EYE_TRACKING = 3
+_TAG_STRESS_TEST = 4
+
+# tag, timestamp, frame, x, y, z
+_HEAD_POSITION_RECORD = struct.Struct('<Bqi3f')
+# tag, timestamp, frame, pitch, yaw, roll, quaternion w, x, y, z
+_HEAD_ROTATION_RECORD = struct.Struct('<Bqi3f4f')
+# tag, timestamp, frame, gaze origin xyz, gaze direction xyz,
+# pupil diameter left/right, blink left/right
+_EYE_TRACKING_RECORD = struct.Struct('<Bqi3f3f2f2?')
+# tag, timestamp, sequence, random value
+_STRESS_TEST_RECORD = struct.Struct('<BqId')
+
+if HAVE_NUMBA:
+    @njit(cache=True, nogil=True)
+    def _build_stress_records(buf, timestamp, first_sequence, value_bits):
+        """
+        Compiled writer for a whole batch of _STRESS_TEST_RECORD layouts
+        
+        Args:
+            buf (numpy.ndarray): uint8 output, one 21-byte record per value
+            timestamp (int): time.time_ns() stamped on every record
+            first_sequence (int): Sequence number of the first record
+            value_bits (numpy.ndarray): Random float64 values viewed as uint64
+        """
+        for k in range(value_bits.shape[0]):
+            off = k * 21
+            buf[off] = 4  # _TAG_STRESS_TEST
+            for b in range(8):
+                buf[off + 1 + b] = (timestamp >> (8 * b)) & 0xFF
+            sequence = first_sequence + k
+            for b in range(4):
+                buf[off + 9 + b] = (sequence >> (8 * b)) & 0xFF
+            bits = value_bits[k]
+            for b in range(8):
+                buf[off + 13 + b] = (bits >> np.uint64(8 * b)) & np.uint64(0xFF)
+
+
+if HAVE_ORJSON:
+    _dumps = orjson.dumps
+else:
+    def _dumps(obj: Any) -> bytes:
+        """Encode obj as compact JSON bytes."""
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+# With msgspec, head pose samples are typed Structs encoded
+# straight to JSON bytes without building dicts; the field order matches
+# the dict payloads, so receivers see the same JSON either way
+if HAVE_MSGSPEC:
+    class _Vector3(msgspec.Struct):
+        x: float
+        y: float
+        z: float
+    
+    class _EulerAngles(msgspec.Struct):
+        pitch: float
+        yaw: float
+        roll: float
+    
+    class _Quaternion(msgspec.Struct):
+        w: float
+        x: float
+        y: float
+        z: float
+    
+    class _HeadPositionSample(msgspec.Struct, kw_only=True):
+        type: str = 'head_position'
+        timestamp: int
+        frame: int
+        position: _Vector3
+    
+    class _HeadRotationSample(msgspec.Struct, kw_only=True):
+        type: str = 'head_rotation'
+        timestamp: int
+        frame: int
+        rotation: _EulerAngles
+        quaternion: _Quaternion
+    
+    # encode() rather than encode_into(): the writer thread still holds
+    # each payload after the test moves on, so buffers cannot be reused
+    _encode_sample = msgspec.json.Encoder().encode
+
+
+# Hand and controller samples always have the same shape, so their JSON is
+# preformatted once and filled in with %-substitution. Floats go through %f
+# (six decimals), which is plenty for test values and always valid JSON.
+_HAND_JOINTS = ('thumb', 'index', 'middle', 'ring', 'pinky')
+_HAND_TEMPLATE = (
+    b'{"type":"hand_tracking","timestamp":%d,"hand":"%s","joints":{'
+    + b','.join(
+        b'"%s":{"position":{"x":%%f,"y":%%f,"z":%%f},"confidence":%%f}' % joint.encode()
+        for joint in _HAND_JOINTS)
+    + b'}}'
+)
+
+_CONTROLLER_BUTTONS = ('trigger', 'grip', 'menu', 'a', 'b')
+_CONTROLLER_TEMPLATE = (
+    b'{"type":"controller_input","timestamp":%d,"controller":"%s","buttons":{'
+    + b','.join(
+        b'"%s":{"pressed":%%s,"value":%%f}' % button.encode()
+        for button in _CONTROLLER_BUTTONS)
+    + b'},"joystick":{"x":%f,"y":%f},"touchpad":{"x":%f,"y":%f,"touched":%s}}'
+)
+
+# JSON literals for booleans substituted into the templates
+_JSON_BOOL = (b'false', b'true')
+
+
+# Random test values are drawn a whole test's worth at a time; with NumPy
+# that is one C-level RNG call instead of one random.uniform per field
+if HAVE_NUMPY:
+    _rng = np.random.default_rng()
+    
+    def _uniform(low, high, size: int) -> list:
+        """
+        Draw uniform random floats.
+        
+        Args:
+            low: Lower bound, or a sequence of per-column lower bounds
+            high: Upper bound, or a sequence of per-column upper bounds
+            size: Number of values (rows when the bounds are sequences)
+            
+        Returns:
+            list: size floats, or size rows of len(low) floats
+        """
+        shape = size if isinstance(low, (int, float)) else (size, len(low))
+        return _rng.uniform(low, high, shape).tolist()
+else:
+    def _uniform(low, high, size: int) -> list:
+        """
+        Draw uniform random floats.
+        
+        Args:
+            low: Lower bound, or a sequence of per-column lower bounds
+            high: Upper bound, or a sequence of per-column upper bounds
+            size: Number of values (rows when the bounds are sequences)
+            
+        Returns:
+            list: size floats, or size rows of len(low) floats
+        """
+        if isinstance(low, (int, float)):
+            return [random.uniform(low, high) for _ in range(size)]
+        bounds = list(zip(low, high))
+        return [[random.uniform(lo, hi) for lo, hi in bounds] for _ in range(size)]
+
+
+class _PooledSocket:
+    """
+    A pooled test socket and its zero-copy state.
+    
+    Zero-copy completions are reported per socket, so the messages still
+    in flight are tracked here rather than per tester: every tester writing
+    to the socket appends to and reaps from the same queue, under lock.
+    """
+    
+    def __init__(self, sock: socket.socket, zerocopy: bool):
+        """Wrap a configured socket; zerocopy tells whether SO_ZEROCOPY is on."""
+        self.sock = sock
+        # Cleared once the kernel reports it copied a zero-copy send anyway
+        self.zerocopy = zerocopy
+        # Zero-copy messages the kernel may still be reading from, oldest first
+        self.inflight: deque = deque()
+        # Serializes zero-copy sends with their inflight entries, and reaping
+        self.lock = threading.Lock()
+
+
+# UDP sockets shared by every VRDataTester in the process, keyed by the
+# (ips, port) they target, so running several testers does not open new fds
+_DATAGRAM_POOL: Dict[Tuple[Tuple[str, ...], int], _PooledSocket] = {}
+
+
+def _pooled_socket(target: Tuple[Tuple[str, ...], int]) -> _PooledSocket:
+    """
+    Get the shared test socket for a target, creating it on first use.
+    
+    A new socket gets a large send buffer, and each target IP is connected
+    once from a scratch socket so its route is resolved before any test
+    starts. Nothing is sent, so receivers never see a warm-up datagram.
+    Where sendmmsg is available, SO_ZEROCOPY is enabled if the kernel
+    supports it.
+    """
+    pooled = _DATAGRAM_POOL.get(target)
+    if pooled is None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _SEND_BUFFER_SIZE)
+        if sys.platform.startswith('linux'):
+            sock.setsockopt(socket.IPPROTO_IP, _IP_MTU_DISCOVER, _IP_PMTUDISC_DONT)
+        
+        ips, port = target
+        for ip in ips:
+            try:
+                with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as probe:
+                    probe.connect((ip, port))
+            except OSError:
+                # The real sends will report a bad target
+                pass
+        
+        zerocopy = False
+        if _libc_sendmmsg is not None:
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, _SO_ZEROCOPY, 1)
+                zerocopy = True
+            except OSError:
+                pass
+        pooled = _DATAGRAM_POOL[target] = _PooledSocket(sock, zerocopy)
+    return pooled
+
+
+def close_socket_pool():
+    """Close every pooled test socket."""
+    for pooled in _DATAGRAM_POOL.values():
+        pooled.sock.close()
+    _DATAGRAM_POOL.clear()
 
 
 class VRDataTester:
     """Automated tester for VR data streaming."""
     
-    def __init__(self, target_port: int = 45001):
+    # Messages queued before send_message flushes them with one sendmmsg
+    BATCH_SIZE: int = 32
+    
+    # Fixed buffer queued messages are copied into; a batch is flushed early
+    # when the next message would not fit
+    ARENA_SIZE: int = 1 << 20
+    
+    # Messages at least this large skip the arena and are sent with
+    # MSG_ZEROCOPY; below it pinning pages costs more than the copy
+    ZEROCOPY_THRESHOLD: int = 2048
+    
+    # Queue items (single messages or send_messages batches) waiting for the
+    # writer thread before senders block until it catches up
+    MAX_QUEUED: int = 4096
+    
+    # Longest a sender waits for the writer thread to catch up, and how
+    # often it checks meanwhile that the writer is still running
+    WRITER_TIMEOUT: float = 30.0
+    WRITER_POLL: float = 0.5
+    
+    def __init__(self, target_port: int = 45001,
+                 target_ips: Sequence[str] = ("127.0.0.1",),
+                 binary: bool = False):
         """
         Initialize the tester.
         
         Args:
             target_port: Port to send test data to
+            target_ips: IP addresses to send test data to; every message
+                        goes to each of them
+            binary: Send position, rotation, eye-tracking and stress samples
+                    as packed binary records instead of JSON
         """
         self.target_port = target_port
+        self.target_ips = tuple(target_ips)
+        self.binary = binary
         self.socket = None
         self.test_results: Dict[str, bool] = {}
+        self._sockaddrs: Dict[Tuple[str, int], Tuple[bytes, int]] = {}
+        
+        # Send arena and the iovec/mmsghdr arrays pointing into it, allocated
+        # once in setup() and reused by every batch
+        self._arena = None
+        self._arena_base = 0
+        self._arena_off = 0
+        self._iovecs = None
+        self._msgs = None
+        self._pending = 0
+        
+        # Reused framing buffer for the plain sendto path (no sendmmsg)
+        self._sendbuf = bytearray(65536)
+        self._sendview = memoryview(self._sendbuf)
+        
+        # Pool entry behind self.socket, which holds the zero-copy state
+        self._pooled: Optional[_PooledSocket] = None
+        
+        # Writer thread that frames and sends queued messages; an Event in
+        # the queue is set once everything before it is sent, None stops it
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer: Optional[threading.Thread] = None
+        self._send_errors = 0
+        
+        # Sender for data messages (type 5), which every test sends; setup()
+        # swaps in a version specialized for the type and targets
+        self._send_5: Callable[[bytes], bool] = functools.partial(self.send_message, 5)
         
     def setup(self) -> bool:
-        """Set up the test socket."""
+        """Set up the test socket (a no-op if it is already set up)."""
+        if self.socket is not None:
+            return True
+        
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            self._pooled = _pooled_socket((self.target_ips, self.target_port))
+            self.socket = self._pooled.sock
+            
+            if _libc_sendmmsg is not None:
+                self._arena = ctypes.create_string_buffer(self.ARENA_SIZE)
+                self._arena_base = ctypes.addressof(self._arena)
+                self._iovecs = (_IOVec * self.BATCH_SIZE)()
+                self._msgs = (_MMsgHdr * self.BATCH_SIZE)()
+                for i in range(self.BATCH_SIZE):
+                    hdr = self._msgs[i].msg_hdr
+                    hdr.msg_iov = ctypes.pointer(self._iovecs[i])
+                    hdr.msg_iovlen = 1
+            
+            self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+            self._writer.start()
+            self._send_5 = self._sender(5)
             return True
         except Exception as e:
             print(f"Failed to set up socket: {e}")
             return False
     
     def cleanup(self):
-        """Clean up resources."""
+        """
+        Clean up resources.
+        
+        The socket itself belongs to the pool and stays open for other
+        testers; close_socket_pool() closes it.
+        """
         if self.socket:
-            self.socket.close()
+            if self._writer is not None:
+                self._queue.put(None)
+                self._writer.join(self.WRITER_TIMEOUT)
+                self._writer = None
+                self._send_5 = functools.partial(self.send_message, 5)
+            self._reap_zerocopy(timeout=1.0)
+            self.socket = None
+            self._pooled = None
     
-    def send_message(self, msg_type: int, payload: str, ip: str = "127.0.0.1") -> bool:
+    def send_message(self, msg_type: int, payload: Union[str, bytes],
+                     ips: Optional[Sequence[str]] = None) -> bool:
         """
         Send a test message.
         
+        The message is handed to the writer thread, which frames it and
+        sends it with the rest of its batch; call flush_batch() at the end
+        of a test to wait for it and collect errors. With several targets
+        the batch holds one entry per target, all pointing at the same
+        copy of the message, so the fan-out costs no extra syscalls.
+        
         Args:
             msg_type: Message type code
-            payload: Message payload
-            ip: Target IP address
+            payload: Message payload, as text or already-encoded bytes
+            ips: Target IP addresses (defaults to target_ips)
             
         Returns:
-            bool: True if sent successfully
+            bool: True if queued successfully
         """
-        try:
-            message = f"{msg_type}|{payload}"
-            self.socket.sendto(message.encode('utf-8'), (ip, self.target_port))
+        if self._writer is None:
+            print("Failed to send message: tester is not set up")
+            return False
+        if ips is None:
+            ips = self.target_ips
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        prefix = _TYPE_PREFIX.get(msg_type) or b"%d|" % msg_type
+        if self._queue.qsize() >= self.MAX_QUEUED:
+            # Let the writer catch up instead of buffering without bound
+            if not self._wait_for_writer():
+                return False
+        self._queue.put((ips, self.target_port, prefix, payload))
+        return True
+    
+    def send_messages(self, msg_type: int, payloads: List[bytes],
+                      ips: Optional[Sequence[str]] = None) -> bool:
+        """
+        Send several messages of one type as a single queue item.
+        
+        Same as calling send_message for each payload, but the test thread
+        and the writer exchange one item (and hand the GIL back and forth
+        once) per batch instead of once per message.
+        
+        Args:
+            msg_type: Message type code
+            payloads: Encoded message payloads
+            ips: Target IP addresses (defaults to target_ips)
+            
+        Returns:
+            bool: True if queued successfully
+        """
+        if self._writer is None:
+            print("Failed to send messages: tester is not set up")
+            return False
+        if ips is None:
+            ips = self.target_ips
+        prefix = _TYPE_PREFIX.get(msg_type) or b"%d|" % msg_type
+        if self._queue.qsize() >= self.MAX_QUEUED:
+            if not self._wait_for_writer():
+                return False
+        self._queue.put((ips, self.target_port, prefix, payloads))
+        return True
+    
+    def _sender(self, msg_type: int) -> Callable[[bytes], bool]:
+        """
+        Build a send_message specialized for one message type.
+        
+        The wire prefix, targets and queue are looked up once here, so each
+        call only checks the queue depth and queues the payload. The sender
+        takes encoded bytes and always sends to target_ips.
+        
+        Args:
+            msg_type: Message type code
+            
+        Returns:
+            Callable: send(payload) -> bool, like send_message(msg_type, payload)
+        """
+        prefix = _TYPE_PREFIX.get(msg_type) or b"%d|" % msg_type
+        ips = self.target_ips
+        port = self.target_port
+        put = self._queue.put
+        qsize = self._queue.qsize
+        limit = self.MAX_QUEUED
+        wait_for_writer = self._wait_for_writer
+        
+        def send(payload: bytes) -> bool:
+            if qsize() >= limit and not wait_for_writer():
+                return False
+            put((ips, port, prefix, payload))
             return True
+        
+        return send
+    
+    def flush_batch(self) -> bool:
+        """
+        Wait until the writer thread has sent every queued message.
+        
+        Returns:
+            bool: True if every message since the last flush was sent
+        """
+        if self._writer is None:
+            return True
+        written = self._wait_for_writer()
+        errors, self._send_errors = self._send_errors, 0
+        return written and errors == 0
+    
+    def _wait_for_writer(self) -> bool:
+        """
+        Block until the writer has sent everything queued so far.
+        
+        Returns:
+            bool: False if the writer stopped or did not catch up within
+                  WRITER_TIMEOUT seconds
+        """
+        writer = self._writer
+        done = threading.Event()
+        self._queue.put(done)
+        deadline = time.monotonic() + self.WRITER_TIMEOUT
+        while not done.wait(self.WRITER_POLL):
+            if writer is None or not writer.is_alive():
+                print("Writer thread is not running; queued messages were not sent")
+                return False
+            if time.monotonic() >= deadline:
+                print("Timed out waiting for the writer thread")
+                return False
+        return True
+    
+    def _writer_loop(self):
+        """Frame and send queued messages in batches until told to stop."""
+        q = self._queue
+        while True:
+            item = q.get()
+            # Drain whatever else is already queued into the same batches
+            while True:
+                if item is None:
+                    self._send_pending_safely()
+                    return
+                if isinstance(item, threading.Event):
+                    # Waiters are released even if the batch fails
+                    self._send_pending_safely()
+                    item.set()
+                else:
+                    try:
+                        ips, port, prefix, payload = item
+                        if isinstance(payload, list):
+                            for single in payload:
+                                self._write(ips, port, prefix, single)
+                        else:
+                            self._write(ips, port, prefix, payload)
+                    except Exception as e:
+                        print(f"Failed to write message: {e}")
+                        self._send_errors += 1
+                try:
+                    item = q.get_nowait()
+                except queue.Empty:
+                    break
+            self._send_pending_safely()
+    
+    def _send_pending_safely(self):
+        """Run _send_pending, counting any failure instead of raising (writer thread)."""
+        try:
+            self._send_pending()
+        except Exception as e:
+            print(f"Failed to send message batch: {e}")
+            self._send_errors += 1
+    
+    def _write(self, ips: Sequence[str], port: int, prefix: bytes,
+               payload: bytes):
+        """Frame one message and add it to the current batch (writer thread)."""
+        try:
+            # The prefix and payload are copied side by side into the send
+            # buffer; no framed bytes object is built on the common paths
+            prefix_len = len(prefix)
+            size = prefix_len + len(payload)
+            
+            if self._msgs is None or size > self.ARENA_SIZE:
+                if size <= len(self._sendbuf):
+                    self._sendbuf[:prefix_len] = prefix
+                    self._sendbuf[prefix_len:size] = payload
+                    message = self._sendview[:size]
+                else:
+                    message = prefix + payload
+                for ip in ips:
+                    self.socket.sendto(message, (ip, port))
+                return
+            
+            if self._pooled.zerocopy and size >= self.ZEROCOPY_THRESHOLD:
+                # Send the batch first so datagrams still leave in order
+                self._send_pending()
+                message = prefix + payload
+                for ip in ips:
+                    self._send_zerocopy(message, (ip, port))
+                return
+            
+            # One arena copy serves every target; it is copied again only if
+            # the batch fills up and the arena is reset partway through
+            base = None
+            for ip in ips:
+                if base is None:
+                    if self._arena_off + size > self.ARENA_SIZE:
+                        self._send_pending()
+                    base = self._arena_base + self._arena_off
+                    ctypes.memmove(base, prefix, prefix_len)
+                    ctypes.memmove(base + prefix_len, payload, size - prefix_len)
+                    self._arena_off += size
+                
+                sockaddr, sockaddr_ptr = self._sockaddr((ip, port))
+                i = self._pending
+                self._iovecs[i].iov_base = base
+                self._iovecs[i].iov_len = size
+                hdr = self._msgs[i].msg_hdr
+                hdr.msg_name = sockaddr_ptr
+                hdr.msg_namelen = len(sockaddr)
+                self._pending = i + 1
+                
+                if self._pending == self.BATCH_SIZE:
+                    self._send_pending()
+                    base = None
         except Exception as e:
             print(f"Failed to send message: {e}")
-            return False
+            self._send_errors += 1
+    
+    def _sockaddr(self, addr: Tuple[str, int]) -> Tuple[bytes, int]:
+        """
+        Get the raw struct sockaddr_in for an address and its buffer address,
+        resolving it once. The cache keeps the bytes alive for sendmmsg.
+        """
+        entry = self._sockaddrs.get(addr)
+        if entry is None:
+            ip, port = addr
+            packed_ip = socket.inet_aton(socket.gethostbyname(ip))
+            sockaddr = _AF_INET_NATIVE + struct.pack('!H4s8x', port, packed_ip)
+            entry = self._sockaddrs[addr] = (sockaddr, ctypes.cast(sockaddr, ctypes.c_void_p).value)
+        return entry
+    
+    def _send_zerocopy(self, message: bytes, addr: Tuple[str, int]):
+        """
+        Send one large message with MSG_ZEROCOPY, straight from its bytes.
+        
+        The message is kept referenced until the kernel reports that it is
+        done with the pages (see _reap_zerocopy).
+        """
+        self._reap_zerocopy()
+        pooled = self._pooled
+        with pooled.lock:
+            # Completions are numbered per socket in send order, so the send
+            # and its inflight entry must not interleave with other testers'
+            try:
+                self.socket.sendmsg([message], [], _MSG_ZEROCOPY, addr)
+            except OSError as e:
+                if e.errno != errno.ENOBUFS:
+                    raise
+                # Out of option memory for pinning pages; copy this one
+                self.socket.sendto(message, addr)
+                return
+            pooled.inflight.append(message)
+    
+    def _reap_zerocopy(self, timeout: float = 0.0):
+        """
+        Release zero-copy messages the kernel has finished sending.
+        
+        Args:
+            timeout: How long to keep waiting for outstanding completions
+        """
+        pooled = self._pooled
+        if pooled is None:
+            return
+        deadline = time.monotonic() + timeout
+        while pooled.inflight:
+            with pooled.lock:
+                try:
+                    _, ancdata, _, _ = self.socket.recvmsg(
+                        0, 256, socket.MSG_ERRQUEUE | socket.MSG_DONTWAIT)
+                except BlockingIOError:
+                    ancdata = None
+                else:
+                    for _, _, data in ancdata:
+                        _, origin, _, code, _, first, last = _SOCK_EXTENDED_ERR.unpack_from(data)
+                        if origin != _SO_EE_ORIGIN_ZEROCOPY:
+                            continue
+                        # Completions cover send calls first..last in order
+                        done = min(((last - first) & 0xffffffff) + 1, len(pooled.inflight))
+                        for _ in range(done):
+                            pooled.inflight.popleft()
+                        if code & _SO_EE_CODE_ZEROCOPY_COPIED:
+                            # The kernel copied anyway (e.g. loopback), so
+                            # pinning only adds overhead from here on
+                            pooled.zerocopy = False
+            
+            if ancdata is None:
+                if time.monotonic() >= deadline:
+                    return
+                time.sleep(0.001)
+    
+    def _send_pending(self):
+        """
+        Send the current batch with as few sendmmsg calls as possible
+        (writer thread). Messages that could not be sent count as errors.
+        """
+        if self._pooled.inflight:
+            self._reap_zerocopy()
+        
+        count = self._pending
+        if not count:
+            return
+        
+        self._pending = 0
+        self._arena_off = 0
+        try:
+            # The kernel may accept only part of the batch; resubmit the rest
+            sent = 0
+            fd = self.socket.fileno()
+            while sent < count:
+                result = _libc_sendmmsg(fd, ctypes.addressof(self._msgs[sent]), count - sent, 0)
+                if result < 0:
+                    raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+                sent += result
+        except Exception as e:
+            print(f"Failed to send message batch: {e}")
+            self._send_errors += count - sent
     
     def test_basic_communication(self):
         """Test basic message sending."""
@@ -77,7 +772,7 @@ class VRDataTester:
         }
         
         # Send DATA message (type 5)
-        success = self.send_message(5, json.dumps(test_data))
+        success = self.send_message(5, json.dumps(test_data)) and self.flush_batch()
         self.test_results['basic_communication'] = success
         
         if success:
@@ -95,22 +790,38 @@ class VRDataTester:
         
         print(f"Sending {num_samples} position samples...")
         
-        for i in range(num_samples):
-            position_data = {
-                'type': 'head_position',
-                'timestamp': time.time_ns(),
-                'frame': i,
-                'position': {
-                    'x': random.uniform(-2.0, 2.0),
-                    'y': random.uniform(0.0, 2.0),
-                    'z': random.uniform(-2.0, 2.0)
-                }
-            }
+        # Built once; each sample only overwrites the fields that change
+        position_data = {
+            'type': 'head_position',
+            'timestamp': 0,
+            'frame': 0,
+            'position': {'x': 0.0, 'y': 0.0, 'z': 0.0}
+        }
+        position = position_data['position']
+        samples = _uniform((-2.0, 0.0, -2.0), (2.0, 2.0, 2.0), num_samples)
+        
+        for i, (x, y, z) in enumerate(samples):
+            # Stamped when built, so receivers can measure real latency
+            timestamp = time.time_ns()
+            if self.binary:
+                payload = _HEAD_POSITION_RECORD.pack(
+                    _TAG_HEAD_POSITION, timestamp, i, x, y, z)
+            elif HAVE_MSGSPEC:
+                payload = _encode_sample(_HeadPositionSample(
+                    timestamp=timestamp, frame=i, position=_Vector3(x, y, z)))
+            else:
+                position_data['timestamp'] = timestamp
+                position_data['frame'] = i
+                position['x'] = x
+                position['y'] = y
+                position['z'] = z
+                payload = _dumps(position_data)
             
-            if self.send_message(5, json.dumps(position_data)):
+            if self._send_5(payload):
                 success_count += 1
-            
-            time.sleep(0.1)
+        
+        if not self.flush_batch():
+            success_count = 0
         
         self.test_results['vr_position'] = (success_count == num_samples)
         print(f"✓ Sent {success_count}/{num_samples} position samples")
@@ -125,28 +836,41 @@ class VRDataTester:
         
         print(f"Sending {num_samples} rotation samples...")
         
+        rotation_data = {
+            'type': 'head_rotation',
+            'timestamp': 0,
+            'frame': 0,
+            'rotation': {'pitch': 0.0, 'yaw': 0.0, 'roll': 0.0},
+            'quaternion': {'w': 0.0, 'x': 0.0, 'y': 0.0, 'z': 0.0}
+        }
+        rotation = rotation_data['rotation']
+        quaternion = rotation_data['quaternion']
+        angles = _uniform((-90.0, -180.0, -180.0), (90.0, 180.0, 180.0), num_samples)
+        quaternions = _uniform((0.0,) * 4, (1.0,) * 4, num_samples)
+        
         for i in range(num_samples):
-            rotation_data = {
-                'type': 'head_rotation',
-                'timestamp': time.time_ns(),
-                'frame': i,
-                'rotation': {
-                    'pitch': random.uniform(-90, 90),
-                    'yaw': random.uniform(-180, 180),
-                    'roll': random.uniform(-180, 180)
-                },
-                'quaternion': {
-                    'w': random.random(),
-                    'x': random.random(),
-                    'y': random.random(),
-                    'z': random.random()
-                }
-            }
+            timestamp = time.time_ns()
+            if self.binary:
+                payload = _HEAD_ROTATION_RECORD.pack(
+                    _TAG_HEAD_ROTATION, timestamp, i, *angles[i], *quaternions[i])
+            elif HAVE_MSGSPEC:
+                payload = _encode_sample(_HeadRotationSample(
+                    timestamp=timestamp, frame=i,
+                    rotation=_EulerAngles(*angles[i]),
+                    quaternion=_Quaternion(*quaternions[i])))
+            else:
+                rotation_data['timestamp'] = timestamp
+                rotation_data['frame'] = i
+                rotation['pitch'], rotation['yaw'], rotation['roll'] = angles[i]
+                (quaternion['w'], quaternion['x'],
+                 quaternion['y'], quaternion['z']) = quaternions[i]
+                payload = _dumps(rotation_data)
             
-            if self.send_message(5, json.dumps(rotation_data)):
+            if self._send_5(payload):
                 success_count += 1
-            
-            time.sleep(0.1)
+        
+        if not self.flush_batch():
+            success_count = 0
         
         self.test_results['vr_rotation'] = (success_count == num_samples)
         print(f"✓ Sent {success_count}/{num_samples} rotation samples")
@@ -157,33 +881,20 @@ class VRDataTester:
         print("-" * 40)
         
         hands = ['left', 'right']
-        joints = ['thumb', 'index', 'middle', 'ring', 'pinky']
         
         success = True
         for hand in hands:
-            hand_data = {
-                'type': 'hand_tracking',
-                'timestamp': time.time_ns(),
-                'hand': hand,
-                'joints': {}
-            }
-            
-            for joint in joints:
-                hand_data['joints'][joint] = {
-                    'position': {
-                        'x': random.uniform(-0.5, 0.5),
-                        'y': random.uniform(-0.5, 0.5),
-                        'z': random.uniform(-0.5, 0.5)
-                    },
-                    'confidence': random.uniform(0.7, 1.0)
-                }
+            # Joint x, y, z and confidence, in template order
+            values = _uniform((-0.5, -0.5, -0.5, 0.7), (0.5, 0.5, 0.5, 1.0), len(_HAND_JOINTS))
+            payload = _HAND_TEMPLATE % (
+                time.time_ns(), hand.encode(), *[v for joint in values for v in joint])
             
-            if not self.send_message(5, json.dumps(hand_data)):
+            if not self._send_5(payload):
                 success = False
             
             print(f"  Sent {hand} hand data")
-            time.sleep(0.1)
         
+        success = self.flush_batch() and success
         self.test_results['hand_tracking'] = success
         if success:
             print("✓ Successfully sent hand tracking data")
@@ -200,37 +911,49 @@ class VRDataTester:
         
         print(f"Sending {num_samples} eye tracking samples...")
         
-        for i in range(num_samples):
-            eye_data = {
-                'type': 'eye_tracking',
-                'timestamp': time.time_ns(),
-                'frame': i,
-                'gaze': {
-                    'origin': {
-                        'x': random.uniform(-0.1, 0.1),
-                        'y': random.uniform(-0.1, 0.1),
-                        'z': 0.0
-                    },
-                    'direction': {
-                        'x': random.uniform(-1.0, 1.0),
-                        'y': random.uniform(-1.0, 1.0),
-                        'z': random.uniform(0.5, 1.0)
-                    }
-                },
-                'pupil_diameter': {
-                    'left': random.uniform(2.0, 8.0),
-                    'right': random.uniform(2.0, 8.0)
-                },
-                'blink': {
-                    'left': random.random() > 0.95,
-                    'right': random.random() > 0.95
-                }
-            }
+        eye_data = {
+            'type': 'eye_tracking',
+            'timestamp': 0,
+            'frame': 0,
+            'gaze': {
+                'origin': {'x': 0.0, 'y': 0.0, 'z': 0.0},
+                'direction': {'x': 0.0, 'y': 0.0, 'z': 0.0}
+            },
+            'pupil_diameter': {'left': 0.0, 'right': 0.0},
+            'blink': {'left': False, 'right': False}
+        }
+        origin = eye_data['gaze']['origin']
+        direction = eye_data['gaze']['direction']
+        pupil = eye_data['pupil_diameter']
+        blink = eye_data['blink']
+        
+        # One row per sample: origin xy, direction xyz, pupils, blink rolls
+        samples = _uniform((-0.1, -0.1, -1.0, -1.0, 0.5, 2.0, 2.0, 0.0, 0.0),
+                           (0.1, 0.1, 1.0, 1.0, 1.0, 8.0, 8.0, 1.0, 1.0),
+                           num_samples)
+        
+        for i, sample in enumerate(samples):
+            timestamp = time.time_ns()
+            if self.binary:
+                payload = _EYE_TRACKING_RECORD.pack(
+                    _TAG_EYE_TRACKING, timestamp, i,
+                    sample[0], sample[1], 0.0, *sample[2:7],
+                    sample[7] > 0.95, sample[8] > 0.95)
+            else:
+                eye_data['timestamp'] = timestamp
+                eye_data['frame'] = i
+                origin['x'], origin['y'] = sample[0:2]
+                direction['x'], direction['y'], direction['z'] = sample[2:5]
+                pupil['left'], pupil['right'] = sample[5:7]
+                blink['left'] = sample[7] > 0.95
+                blink['right'] = sample[8] > 0.95
+                payload = _dumps(eye_data)
             
-            if self.send_message(5, json.dumps(eye_data)):
+            if self._send_5(payload):
                 success_count += 1
-            
-            time.sleep(0.05)
+        
+        if not self.flush_batch():
+            success_count = 0
         
         self.test_results['eye_tracking'] = (success_count == num_samples)
         print(f"✓ Sent {success_count}/{num_samples} eye tracking samples")
@@ -241,38 +964,26 @@ class VRDataTester:
         print("-" * 40)
         
         controllers = ['left', 'right']
-        buttons = ['trigger', 'grip', 'menu', 'a', 'b']
         
         success = True
         for controller in controllers:
-            controller_data = {
-                'type': 'controller_input',
-                'timestamp': time.time_ns(),
-                'controller': controller,
-                'buttons': {},
-                'joystick': {
-                    'x': random.uniform(-1.0, 1.0),
-                    'y': random.uniform(-1.0, 1.0)
-                },
-                'touchpad': {
-                    'x': random.uniform(-1.0, 1.0),
-                    'y': random.uniform(-1.0, 1.0),
-                    'touched': random.random() > 0.5
-                }
-            }
+            fields = []
+            for pressed, value in _uniform((0.0, 0.0), (1.0, 1.0), len(_CONTROLLER_BUTTONS)):
+                fields.append(_JSON_BOOL[pressed > 0.7])
+                fields.append(value)
             
-            for button in buttons:
-                controller_data['buttons'][button] = {
-                    'pressed': random.random() > 0.7,
-                    'value': random.random()
-                }
+            # Joystick xy, touchpad xy, then the touched roll
+            jx, jy, tx, ty, touch = _uniform((-1.0,) * 4 + (0.0,), (1.0,) * 5, 1)[0]
+            payload = _CONTROLLER_TEMPLATE % (
+                time.time_ns(), controller.encode(), *fields,
+                jx, jy, tx, ty, _JSON_BOOL[touch > 0.5])
             
-            if not self.send_message(5, json.dumps(controller_data)):
+            if not self._send_5(payload):
                 success = False
             
             print(f"  Sent {controller} controller data")
-            time.sleep(0.1)
         
+        success = self.flush_batch() and success
         self.test_results['controller_input'] = success
         if success:
             print("✓ Successfully sent controller input data")
@@ -300,7 +1011,7 @@ class VRDataTester:
             }
         }
         
-        success = self.send_message(5, json.dumps(metrics_data))
+        success = self.send_message(5, json.dumps(metrics_data)) and self.flush_batch()
         self.test_results['performance_metrics'] = success
         
         if success:
@@ -324,22 +1035,22 @@ class VRDataTester:
         }
         
         # Add multiple data points
-        for i in range(100):
-            large_data['data'].append({
+        values = _uniform(0.0, 1.0, 100)
+        nested = _uniform((0.0,) * 3, (1.0,) * 3, 100)
+        large_data['data'] = [
+            {
                 'index': i,
-                'value': random.random(),
-                'nested': {
-                    'x': random.random(),
-                    'y': random.random(),
-                    'z': random.random()
-                }
-            })
+                'value': values[i],
+                'nested': {'x': x, 'y': y, 'z': z}
+            }
+            for i, (x, y, z) in enumerate(nested)
+        ]
         
         payload = json.dumps(large_data)
         payload_size = len(payload)
         print(f"Sending payload of {payload_size} bytes...")
         
-        success = self.send_message(5, payload)
+        success = self.send_message(5, payload) and self.flush_batch()
         self.test_results['large_payload'] = success
         
         if success:
@@ -357,27 +1068,63 @@ class VRDataTester:
         print(f"\n[TEST] Stress Test ({duration} seconds)")
         print("-" * 40)
         
+        # Binary records are built a batch at a time by the compiled kernel
+        compiled = self.binary and HAVE_NUMBA
+        if compiled:
+            record_size = _STRESS_TEST_RECORD.size
+            records = np.empty(self.BATCH_SIZE * record_size, dtype=np.uint8)
+            # Compile (or load from cache) before the clock starts
+            _build_stress_records(records, 0, 0, np.zeros(self.BATCH_SIZE, dtype=np.uint64))
+        
         start_time = time.time()
         message_count = 0
         error_count = 0
         
         print(f"Sending rapid messages for {duration} seconds...")
         
-        while time.time() - start_time < duration:
-            test_data = {
-                'type': 'stress_test',
-                'timestamp': time.time_ns(),
-                'sequence': message_count,
-                'random_data': random.random()
-            }
+        # Build a whole batch between deadline checks and queue it as one
+        # item, so the writer sends it with one sendmmsg while this thread
+        # builds the next. The clock is read once per batch, and that
+        # reading is also every message's timestamp.
+        deadline_ns = time.time_ns() + duration * 1_000_000_000
+        test_data = {
+            'type': 'stress_test',
+            'timestamp': 0,
+            'sequence': 0,
+            'random_data': 0.0
+        }
+        while True:
+            now_ns = time.time_ns()
+            if now_ns >= deadline_ns:
+                break
             
-            if self.send_message(5, json.dumps(test_data)):
-                message_count += 1
+            if compiled:
+                _build_stress_records(records, now_ns, message_count,
+                                      _rng.random(self.BATCH_SIZE).view(np.uint64))
+                data = records.tobytes()
+                payloads = [data[off:off + record_size]
+                            for off in range(0, len(data), record_size)]
+            elif self.binary:
+                payloads = [
+                    _STRESS_TEST_RECORD.pack(
+                        _TAG_STRESS_TEST, now_ns, message_count + k, random.random())
+                    for k in range(self.BATCH_SIZE)
+                ]
             else:
-                error_count += 1
+                test_data['timestamp'] = now_ns
+                payloads = []
+                for k in range(self.BATCH_SIZE):
+                    test_data['sequence'] = message_count + k
+                    test_data['random_data'] = random.random()
+                    payloads.append(_dumps(test_data))
             
-            # Small delay to prevent overwhelming the network
-            time.sleep(0.001)
+            if self.send_messages(5, payloads):
+                message_count += len(payloads)
+            else:
+                error_count += 1
+        
+        if not self.flush_batch():
+            error_count += 1
         
         elapsed = time.time() - start_time
         rate = message_count / elapsed
@@ -400,31 +1147,16 @@ class VRDataTester:
             return False
         
         try:
-            # Run all tests
+            # Run all tests; each one ends with flush_batch(), which waits
+            # until its messages are sent, so no drain pause is needed
             self.test_basic_communication()
-            time.sleep(0.5)
-            
             self.test_vr_position_data()
-            time.sleep(0.5)
-            
             self.test_vr_rotation_data()
-            time.sleep(0.5)
-            
             self.test_hand_tracking_data()
-            time.sleep(0.5)
-            
             self.test_eye_tracking_data()
-            time.sleep(0.5)
-            
             self.test_controller_input()
-            time.sleep(0.5)
-            
             self.test_performance_metrics()
-            time.sleep(0.5)
-            
             self.test_large_payload()
-            time.sleep(0.5)
-            
             self.test_stress(duration=3)
             
             # Print summary
@@ -457,6 +1189,20 @@ class VRDataTester:
             print(f"\n⚠️  {total_tests - passed_tests} test(s) failed")
 
 
+# --test name -> VRDataTester method; the stress test also takes its duration
+TEST_MAP: Dict[str, Callable[[VRDataTester], None]] = {
+    'basic': VRDataTester.test_basic_communication,
+    'position': VRDataTester.test_vr_position_data,
+    'rotation': VRDataTester.test_vr_rotation_data,
+    'hand': VRDataTester.test_hand_tracking_data,
+    'eye': VRDataTester.test_eye_tracking_data,
+    'controller': VRDataTester.test_controller_input,
+    'performance': VRDataTester.test_performance_metrics,
+    'large': VRDataTester.test_large_payload,
+    'stress': VRDataTester.test_stress,
+}
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -471,14 +1217,15 @@ def main():
     parser.add_argument(
         '--target',
         type=str,
-        default='127.0.0.1',
-        help='Target IP address (default: 127.0.0.1)'
+        nargs='+',
+        default=['127.0.0.1'],
+        help='Target IP address(es); each message goes to all of them '
+             '(default: 127.0.0.1)'
     )
     parser.add_argument(
         '--test',
         type=str,
-        choices=['all', 'basic', 'position', 'rotation', 'hand', 'eye', 
-                'controller', 'performance', 'large', 'stress'],
+        choices=['all', *TEST_MAP],
         default='all',
         help='Specific test to run (default: all)'
     )
@@ -488,36 +1235,34 @@ def main():
         default=5,
         help='Duration for stress test in seconds (default: 5)'
     )
+    parser.add_argument(
+        '--binary',
+        action='store_true',
+        help='Send position, rotation, eye-tracking and stress samples as '
+             'packed binary records instead of JSON (receiver must support it)'
+    )
     
     args = parser.parse_args()
     
     # Create tester
-    tester = VRDataTester(target_port=args.port)
-    
-    if not tester.setup():
-        print("Failed to initialize tester")
-        return 1
+    tester = VRDataTester(target_port=args.port, target_ips=args.target,
+                          binary=args.binary)
     
     try:
-        # Run specific test or all tests
+        # Run specific test or all tests (run_all_tests sets up on its own)
         if args.test == 'all':
             success = tester.run_all_tests()
         else:
-            test_map = {
-                'basic': tester.test_basic_communication,
-                'position': tester.test_vr_position_data,
-                'rotation': tester.test_vr_rotation_data,
-                'hand': tester.test_hand_tracking_data,
-                'eye': tester.test_eye_tracking_data,
-                'controller': tester.test_controller_input,
-                'performance': tester.test_performance_metrics,
-                'large': tester.test_large_payload,
-                'stress': lambda: tester.test_stress(args.stress_duration)
-            }
+            if not tester.setup():
+                print("Failed to initialize tester")
+                return 1
             
-            test_func = test_map.get(args.test)
-            if test_func:
-                test_func()
+            test_func = TEST_MAP.get(args.test)
+            if test_func is VRDataTester.test_stress:
+                tester.test_stress(args.stress_duration)
+                success = True
+            elif test_func:
+                test_func(tester)
                 success = True
             else:
                 print(f"Unknown test: {args.test}")
@@ -527,6 +1272,7 @@ def main():
         
     finally:
         tester.cleanup()
+        close_socket_pool()
 
 
 if __name__ == '__main__':